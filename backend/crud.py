@@ -2,11 +2,18 @@
 CRUD operations for database models
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from typing import List, Optional, Dict, Any
+from sqlalchemy import func, and_, or_, insert, update, delete, select, lambda_stmt
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date, datetime, timedelta
-import json
+from collections import Counter
+from functools import lru_cache
+import base64
+import hashlib
 import os
+import time
+
+import numpy as np
+import orjson
 
 from models import (
     Plant, Schedule, Forecast, Weather, Deviation, Report, Template, WhatsAppData, MeterData
@@ -18,34 +25,149 @@ from schemas import (
 )
 
 
+@lru_cache(maxsize=512)
+def _parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD string; C fast path, memoized since dashboard
+    queries repeat the same few date filters"""
+    return date.fromisoformat(value)
+
+
+# ==================== PAGINATION HELPERS ====================
+# Keyset (cursor) pagination: instead of OFFSET n (which scans and discards
+# n rows per request), the cursor encodes the sort key of the last row served
+# and the next page filters on it directly. "|" is used as the separator since
+# ISO datetimes contain ":".
+def _encode_cursor(*parts) -> str:
+    """Encode cursor parts into an opaque base64 token"""
+    raw = "|".join(str(p) for p in parts)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, expected_parts: int) -> Optional[List[str]]:
+    """Decode an opaque cursor token; returns None if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        return None
+    parts = raw.split("|")
+    if len(parts) != expected_parts:
+        return None
+    return parts
+
+
 # ==================== PLANT CRUD ====================
+def _table_etag(db: Session, model, ts_column) -> str:
+    """Weak ETag for a whole table: one SELECT max(ts), count(*) round-trip.
+
+    Any insert, delete or timestamped update changes the value, so polling
+    clients can be answered with 304 without running the full list query."""
+    max_ts, count = db.execute(
+        select(func.max(ts_column), func.count()).select_from(model)
+    ).one()
+    return 'W/"{}"'.format(hashlib.sha1(f"{max_ts}-{count}".encode()).hexdigest())
+
+
+def get_plants_etag(db: Session) -> str:
+    """ETag for the plants table (lastUpdated is bumped on every update)"""
+    return _table_etag(db, Plant, Plant.lastUpdated)
+
+
+def get_templates_etag(db: Session) -> str:
+    """ETag for the templates table"""
+    return _table_etag(db, Template, Template.createdAt)
+
+
+def get_whatsapp_data_etag(db: Session) -> str:
+    """ETag for the whatsapp_data table (updatedAt bumps on every update)"""
+    return _table_etag(db, WhatsAppData, WhatsAppData.updatedAt)
+
+
+def get_meter_data_etag(db: Session) -> str:
+    """ETag for the meter_data table (updatedAt bumps on every update)"""
+    return _table_etag(db, MeterData, MeterData.updatedAt)
+
+
+def get_schedule_readiness_etag(db: Session) -> str:
+    """ETag for the schedule_readiness table (updated_at bumps on update)"""
+    return _table_etag(db, ScheduleReadiness, ScheduleReadiness.updated_at)
+
+
+def get_schedule_notifications_etag(db: Session) -> str:
+    """ETag for the schedule_notifications table.
+
+    Notifications have no updated_at, so the unread count is folded in to
+    make mark-as-read visible to polling clients."""
+    max_ts, count, unread = db.execute(
+        select(
+            func.max(ScheduleNotification.created_at),
+            func.count(),
+            func.count().filter(ScheduleNotification.read == False),
+        ).select_from(ScheduleNotification)
+    ).one()
+    return 'W/"{}"'.format(hashlib.sha1(f"{max_ts}-{count}-{unread}".encode()).hexdigest())
+
+
 def get_plants(
     db: Session,
     skip: int = 0,
-    limit: int = 1000,
+    limit: int = 50,
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     type: Optional[str] = None,
     state: Optional[str] = None,
-    status: Optional[str] = None
-) -> List[Plant]:
-    """Get all plants with optional filtering"""
-    query = db.query(Plant)
-    
+    status: Optional[str] = None,
+    columns: Optional[Tuple[str, ...]] = None
+) -> Tuple[List[Plant], Optional[str]]:
+    """Get all plants with optional filtering (keyset-paginated on id).
+
+    When ``columns`` is given, only those attributes are selected and plain
+    Row results are returned instead of ORM instances; ``id`` must be
+    included for cursor pagination to work."""
+    # lambda_stmt caches the compiled SQL per filter combination; repeated
+    # requests skip statement compilation and only swap bound parameters
+    stmt = lambda_stmt(lambda: select(Plant))
+
     if search:
-        query = query.filter(Plant.name.ilike(f"%{search}%"))
+        pattern = f"%{search}%"
+        stmt += lambda s: s.where(Plant.name.ilike(pattern))
     if type:
-        query = query.filter(Plant.type == type)
+        stmt += lambda s: s.where(Plant.type == type)
     if state:
-        query = query.filter(Plant.state == state)
+        stmt += lambda s: s.where(Plant.state == state)
     if status:
-        query = query.filter(Plant.status == status)
-    
-    return query.offset(skip).limit(limit).all()
+        stmt += lambda s: s.where(Plant.status == status)
+
+    if cursor:
+        parts = _decode_cursor(cursor, 1)
+        if parts:
+            try:
+                cur_id = int(parts[0])
+            except ValueError:
+                pass
+            else:
+                stmt += lambda s: s.where(Plant.id > cur_id)
+    elif skip:
+        # Deprecated fallback for callers still sending offsets
+        stmt += lambda s: s.offset(skip)
+
+    stmt += lambda s: s.order_by(Plant.id).limit(limit)
+
+    if columns:
+        # Project only the requested columns; track_on keys the lambda
+        # cache on the column set so different projections don't collide
+        cols = tuple(getattr(Plant, c) for c in columns)
+        stmt = stmt.add_criteria(lambda s: s.with_only_columns(*cols), track_on=cols)
+        results = db.execute(stmt).all()
+    else:
+        results = db.scalars(stmt).all()
+
+    next_cursor = _encode_cursor(results[-1].id) if len(results) == limit else None
+    return results, next_cursor
 
 
 def get_plant(db: Session, plant_id: int) -> Optional[Plant]:
     """Get a single plant by ID"""
-    return db.query(Plant).filter(Plant.id == plant_id).first()
+    return db.get(Plant, plant_id)
 
 
 def create_plant(db: Session, plant: PlantCreate) -> Plant:
@@ -53,34 +175,31 @@ def create_plant(db: Session, plant: PlantCreate) -> Plant:
     db_plant = Plant(**plant.dict())
     db.add(db_plant)
     db.commit()
-    db.refresh(db_plant)
+    invalidate_dashboard_stats_cache()
     return db_plant
 
 
 def update_plant(db: Session, plant_id: int, plant: PlantUpdate) -> Optional[Plant]:
     """Update an existing plant"""
-    db_plant = get_plant(db, plant_id)
-    if not db_plant:
-        return None
-    
     update_data = plant.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_plant, key, value)
-    
+    if not update_data:
+        return get_plant(db, plant_id)
+
+    # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE
+    db_plant = db.scalars(
+        update(Plant).where(Plant.id == plant_id).values(**update_data).returning(Plant)
+    ).first()
     db.commit()
-    db.refresh(db_plant)
+    invalidate_dashboard_stats_cache()
     return db_plant
 
 
 def delete_plant(db: Session, plant_id: int) -> bool:
     """Delete a plant"""
-    db_plant = get_plant(db, plant_id)
-    if not db_plant:
-        return False
-    
-    db.delete(db_plant)
+    result = db.execute(delete(Plant).where(Plant.id == plant_id))
     db.commit()
-    return True
+    invalidate_dashboard_stats_cache()
+    return result.rowcount > 0
 
 
 # ==================== SCHEDULE CRUD ====================
@@ -88,47 +207,88 @@ def get_schedules(
     db: Session,
     skip: int = 0,
     limit: int = 10,  # Default limit to 10
+    cursor: Optional[str] = None,
     type: Optional[str] = None,
     status: Optional[str] = None,
     plant: Optional[str] = None,
     startDate: Optional[str] = None,
-    endDate: Optional[str] = None
-) -> List[Schedule]:
-    """Get all schedules with optional filtering"""
-    query = db.query(Schedule)
-    
+    endDate: Optional[str] = None,
+    columns: Optional[Tuple[str, ...]] = None
+) -> Tuple[List[Schedule], Optional[str]]:
+    """Get all schedules with optional filtering (keyset-paginated on scheduleDate, id).
+
+    When ``columns`` is given, only those attributes are selected and plain
+    Row results are returned instead of ORM instances - this keeps the large
+    ``blockData`` JSON out of list responses. ``scheduleDate`` and ``id``
+    must be included for cursor pagination to work."""
+    stmt = lambda_stmt(lambda: select(Schedule))
+
     if type:
-        query = query.filter(Schedule.type == type)
+        stmt += lambda s: s.where(Schedule.type == type)
     if status:
-        query = query.filter(Schedule.status == status)
+        stmt += lambda s: s.where(Schedule.status == status)
     if plant:
-        query = query.filter(Schedule.plantName == plant)
+        stmt += lambda s: s.where(Schedule.plantName == plant)
     if startDate:
         try:
-            query = query.filter(Schedule.scheduleDate >= datetime.strptime(startDate, "%Y-%m-%d").date())
+            start_date = _parse_date(startDate)
         except ValueError:
             pass
+        else:
+            stmt += lambda s: s.where(Schedule.scheduleDate >= start_date)
     if endDate:
         try:
-            query = query.filter(Schedule.scheduleDate <= datetime.strptime(endDate, "%Y-%m-%d").date())
+            end_date = _parse_date(endDate)
         except ValueError:
             pass
-    
+        else:
+            stmt += lambda s: s.where(Schedule.scheduleDate <= end_date)
+
     # Ensure limit is reasonable (between 1 and 100)
     if limit > 100:
         limit = 100
     if limit < 1:
         limit = 1
-    
-    results = query.order_by(Schedule.scheduleDate.desc(), Schedule.id.desc()).offset(skip).limit(limit).all()
-    
+
+    if cursor:
+        parts = _decode_cursor(cursor, 2)
+        if parts:
+            try:
+                cur_date = _parse_date(parts[0])
+                cur_id = int(parts[1])
+            except ValueError:
+                pass
+            else:
+                # Matches order_by(scheduleDate.desc(), id.desc()) below
+                stmt += lambda s: s.where(or_(
+                    Schedule.scheduleDate < cur_date,
+                    and_(Schedule.scheduleDate == cur_date, Schedule.id < cur_id)
+                ))
+    elif skip:
+        # Deprecated fallback for callers still sending offsets
+        stmt += lambda s: s.offset(skip)
+
+    stmt += lambda s: s.order_by(Schedule.scheduleDate.desc(), Schedule.id.desc()).limit(limit)
+
+    if columns:
+        cols = tuple(getattr(Schedule, c) for c in columns)
+        stmt = stmt.add_criteria(lambda s: s.with_only_columns(*cols), track_on=cols)
+        results = db.execute(stmt).all()
+    else:
+        results = db.scalars(stmt).all()
+
+    next_cursor = None
+    if len(results) == limit:
+        last = results[-1]
+        next_cursor = _encode_cursor(last.scheduleDate.isoformat(), last.id)
+
     # Return SQLAlchemy models directly - FastAPI will handle serialization
-    return results
+    return results, next_cursor
 
 
 def get_schedule(db: Session, schedule_id: int) -> Optional[Schedule]:
     """Get a single schedule by ID"""
-    return db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    return db.get(Schedule, schedule_id)
 
 
 def create_schedule(db: Session, schedule: ScheduleCreate) -> Schedule:
@@ -141,14 +301,12 @@ def create_schedule(db: Session, schedule: ScheduleCreate) -> Schedule:
         deviation = ((schedule.actual - schedule.forecasted) / schedule.forecasted * 100) if schedule.forecasted > 0 else 0.0
     schedule_dict['deviation'] = deviation
     
-    # Convert blockData dict to JSON string if present
-    if schedule_dict.get('blockData'):
-        schedule_dict['blockData'] = json.dumps(schedule_dict['blockData'])
-    
+    # blockData is a JSON/JSONB column - the dialect serializes the dict
     db_schedule = Schedule(**schedule_dict)
     db.add(db_schedule)
     db.commit()
     db.refresh(db_schedule)
+    invalidate_dashboard_stats_cache()
     return db_schedule
 
 
@@ -167,27 +325,27 @@ def update_schedule(db: Session, schedule_id: int, schedule: ScheduleUpdate) ->
         if forecasted and actual:
             update_data['deviation'] = ((actual - forecasted) / forecasted * 100) if forecasted > 0 else 0.0
     
-    # Convert blockData dict to JSON string if present
+    # Unchanged payloads skip the assignment entirely so the flush does not
+    # mark the JSON column dirty and re-write the 96-block blob
     if 'blockData' in update_data and update_data['blockData']:
-        update_data['blockData'] = json.dumps(update_data['blockData'])
-    
+        if update_data['blockData'] == db_schedule.blockData:
+            del update_data['blockData']
+
     for key, value in update_data.items():
         setattr(db_schedule, key, value)
     
     db.commit()
     db.refresh(db_schedule)
+    invalidate_dashboard_stats_cache()
     return db_schedule
 
 
 def delete_schedule(db: Session, schedule_id: int) -> bool:
     """Delete a schedule"""
-    db_schedule = get_schedule(db, schedule_id)
-    if not db_schedule:
-        return False
-    
-    db.delete(db_schedule)
+    result = db.execute(delete(Schedule).where(Schedule.id == schedule_id))
     db.commit()
-    return True
+    invalidate_dashboard_stats_cache()
+    return result.rowcount > 0
 
 
 def get_schedule_with_blocks(db: Session, schedule_id: int) -> Optional[Dict[str, Any]]:
@@ -209,14 +367,15 @@ def get_schedule_with_blocks(db: Session, schedule_id: int) -> Optional[Dict[str
         "createdAt": db_schedule.createdAt
     }
     
-    # Parse blockData
-    if db_schedule.blockData:
+    # blockData arrives pre-parsed from the JSON/JSONB column; rows written
+    # before the column migration may still hold a string
+    block_data = db_schedule.blockData
+    if isinstance(block_data, str):
         try:
-            schedule_dict["blockData"] = json.loads(db_schedule.blockData)
-        except json.JSONDecodeError:
-            schedule_dict["blockData"] = {}
-    else:
-        schedule_dict["blockData"] = {}
+            block_data = orjson.loads(block_data)
+        except orjson.JSONDecodeError:
+            block_data = {}
+    schedule_dict["blockData"] = block_data or {}
     
     return schedule_dict
 
@@ -225,71 +384,87 @@ def calculate_deviations_from_blocks(blockData: Dict[str, Any]) -> List[Dict[str
     """Calculate deviations from schedule block data"""
     if not blockData:
         return []
-    
-    deviations = []
-    for block_key, block_info in blockData.items():
-        if isinstance(block_info, dict):
-            forecasted = block_info.get("forecasted", 0)
-            actual = block_info.get("actual", 0)
-            scheduled = block_info.get("scheduled", 0)
-            
-            deviation = actual - forecasted
-            percentage = (deviation / forecasted * 100) if forecasted > 0 else 0
-            
-            deviations.append({
-                "time": block_info.get("time", block_key),
-                "block": block_info.get("block", 0),
-                "forecasted": forecasted,
-                "actual": actual,
-                "scheduled": scheduled,
-                "deviation": deviation,
-                "percentage": round(percentage, 2)
-            })
-    
-    return deviations
+
+    blocks = [(key, info) for key, info in blockData.items() if isinstance(info, dict)]
+    if not blocks:
+        return []
+
+    # Vectorize the per-block arithmetic: one pass over three float arrays
+    # instead of 96 scalar subtract/divide/round operations
+    forecasted = np.array([info.get("forecasted", 0) for _, info in blocks], dtype=np.float64)
+    actual = np.array([info.get("actual", 0) for _, info in blocks], dtype=np.float64)
+    scheduled = np.array([info.get("scheduled", 0) for _, info in blocks], dtype=np.float64)
+
+    deviation = actual - forecasted
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage = np.where(forecasted > 0, deviation / forecasted * 100, 0.0).round(2)
+
+    return [
+        {
+            "time": info.get("time", key),
+            "block": info.get("block", 0),
+            "forecasted": f,
+            "actual": a,
+            "scheduled": s,
+            "deviation": d,
+            "percentage": p
+        }
+        for (key, info), f, a, s, d, p in zip(
+            blocks, forecasted.tolist(), actual.tolist(), scheduled.tolist(),
+            deviation.tolist(), percentage.tolist()
+        )
+    ]
 
 
 def create_deviation_from_schedule(db: Session, schedule: Schedule) -> List[Deviation]:
     """Create deviation records from a schedule's block data"""
     if not schedule.blockData:
         return []
-    
-    try:
-        blockData = json.loads(schedule.blockData)
-    except json.JSONDecodeError:
-        return []
-    
-    deviations = []
+
+    # Pre-parsed by the JSON/JSONB column; legacy rows may hold a string
+    blockData = schedule.blockData
+    if isinstance(blockData, str):
+        try:
+            blockData = orjson.loads(blockData)
+        except orjson.JSONDecodeError:
+            return []
+
+    mappings = []
     for block_key, block_info in blockData.items():
         if isinstance(block_info, dict):
             # Get hour from time
+            # Fixed "HH:MM" format - slice parse avoids the throwaway list
+            # that split(":") allocates for every one of the 96 blocks
             time_str = block_info.get("time", "00:00")
             try:
-                hour = int(time_str.split(":")[0])
-            except (ValueError, IndexError):
+                hour = int(time_str[:time_str.index(":")])
+            except (ValueError, TypeError, AttributeError):
                 hour = 0
-            
+
             forecasted = block_info.get("forecasted", 0)
             actual = block_info.get("actual", 0)
-            deviation = actual - forecasted
-            
-            # Create deviation record
-            deviation_record = Deviation(
-                hour=hour,
-                deviation=deviation,
-                forecasted=forecasted,
-                actual=actual,
-                plantId=None  # Will be set by join query
-            )
-            db.add(deviation_record)
-            deviations.append(deviation_record)
-    
+
+            mappings.append({
+                "hour": hour,
+                "deviation": actual - forecasted,
+                "forecasted": forecasted,
+                "actual": actual,
+                "plantId": None  # Will be set by join query
+            })
+
+    if not mappings:
+        return []
+
+    # Single batched INSERT ... RETURNING instead of per-row add + commit +
+    # N refresh round-trips (one SELECT per block previously)
+    deviations = db.scalars(
+        insert(Deviation).returning(Deviation),
+        mappings
+    ).all()
     db.commit()
-    # Refresh to get IDs
-    for dev in deviations:
-        db.refresh(dev)
-    
-    return deviations
+    invalidate_deviation_export_cache()
+
+    return list(deviations)
 
 
 # ==================== FORECAST CRUD ====================
@@ -315,41 +490,37 @@ def get_forecast(db: Session, plant_id: int) -> Optional[Forecast]:
 
 def create_forecast(db: Session, forecast: ForecastCreate) -> Forecast:
     """Create a new forecast"""
-    forecast_dict = forecast.dict()
-    if forecast_dict.get('hourlyData'):
-        forecast_dict['hourlyData'] = json.dumps(forecast_dict['hourlyData'])
-    
-    db_forecast = Forecast(**forecast_dict)
+    # hourlyData is a JSON/JSONB column - the dialect serializes the dict
+    db_forecast = Forecast(**forecast.dict())
     db.add(db_forecast)
     db.commit()
-    db.refresh(db_forecast)
     return db_forecast
 
 
 # ==================== WEATHER CRUD ====================
 def get_weather_data(
     db: Session,
-    location: Optional[str] = None
+    location: Optional[str] = None,
+    limit: int = 500
 ) -> List[Weather]:
     """Get weather data with optional location filter"""
     query = db.query(Weather)
-    
+
     if location:
         query = query.filter(Weather.location == location)
-    
-    return query.all()
+
+    # Bounded result set - an unlimited .all() materializes the whole table
+    # as ORM instances. Internal full-table consumers should iterate
+    # db.execute(select(Weather).execution_options(yield_per=1000)) instead.
+    return query.limit(limit).all()
 
 
 def create_weather(db: Session, weather: WeatherCreate) -> Weather:
     """Create new weather data"""
-    weather_dict = weather.dict()
-    if weather_dict.get('forecast'):
-        weather_dict['forecast'] = json.dumps(weather_dict['forecast'])
-    
-    db_weather = Weather(**weather_dict)
+    # forecast is a JSON/JSONB column - the dialect serializes the dict
+    db_weather = Weather(**weather.dict())
     db.add(db_weather)
     db.commit()
-    db.refresh(db_weather)
     return db_weather
 
 
@@ -362,8 +533,19 @@ def get_deviations(
     plantId: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """Get deviations with plant information"""
+    # Project only the columns the response needs instead of hydrating full
+    # Deviation/Plant ORM instances - cuts bytes fetched and skips
+    # identity-map/InstanceState bookkeeping per row.
     # Left join with Plant table to get plant details (handles null plantId)
-    query = db.query(Deviation, Plant).outerjoin(Plant, Deviation.plantId == Plant.id)
+    query = db.query(
+        Deviation.hour,
+        Deviation.forecasted,
+        Deviation.actual,
+        Deviation.deviation,
+        Deviation.plantId,
+        Plant.name,
+        Plant.type
+    ).outerjoin(Plant, Deviation.plantId == Plant.id)
 
     if plantId:
         query = query.filter(Deviation.plantId == plantId)
@@ -379,69 +561,134 @@ def get_deviations(
 
     # Transform to expected format with plant information
     deviations = []
-    for dev, plant in results:
-        percentage = ((dev.actual - dev.forecasted) / dev.forecasted * 100) if dev.forecasted > 0 else 0.0
-        # Handle case where plant is None (null plantId)
-        plant_name = plant.name if plant else f"Plant {dev.plantId or 'Unknown'}"
-        plant_type = plant.type if plant else "Unknown"
+    for hour, forecasted, actual, deviation, plant_id, plant_name, plant_type in results:
+        percentage = ((actual - forecasted) / forecasted * 100) if forecasted > 0 else 0.0
+        # Handle case where plant columns are NULL (unmatched plantId)
+        if plant_name is None:
+            plant_name = f"Plant {plant_id or 'Unknown'}"
+            plant_type = "Unknown"
         deviations.append({
-            "time": f"{dev.hour % 24:02d}:00",  # Format hour as HH:00
-            "hour": dev.hour,
+            "time": f"{hour % 24:02d}:00",  # Format hour as HH:00
+            "hour": hour,
             "plant": plant_name,
             "type": plant_type,
-            "scheduled": dev.forecasted,
-            "actual": dev.actual,
-            "deviation": dev.deviation,
+            "scheduled": forecasted,
+            "actual": actual,
+            "deviation": deviation,
             "percentage": round(percentage, 1)
         })
 
     return deviations
 
 
+# The export endpoint always serves the same hourly slice
+# (period="hourly", limit=1000, no plant filter), so the computed
+# join-plus-transform result is kept precomputed in-process and refreshed
+# only when deviation rows change - denormalize-on-write in miniature,
+# following the dashboard-stats cache above. Per-worker cache.
+_DEVIATION_EXPORT_TTL = 60.0
+_deviation_export_cache: Optional[List[Dict[str, Any]]] = None
+_deviation_export_expiry = 0.0
+
+
+def invalidate_deviation_export_cache() -> None:
+    """Drop the precomputed export payload after a deviation write"""
+    global _deviation_export_cache, _deviation_export_expiry
+    _deviation_export_cache = None
+    _deviation_export_expiry = 0.0
+
+
+def get_deviations_for_export(db: Session) -> List[Dict[str, Any]]:
+    """Hourly deviations for the export endpoints, precomputed between writes"""
+    global _deviation_export_cache, _deviation_export_expiry
+    if _deviation_export_cache is not None and time.monotonic() < _deviation_export_expiry:
+        return _deviation_export_cache
+    deviations = get_deviations(db, period="hourly", limit=1000)
+    _deviation_export_cache = deviations
+    _deviation_export_expiry = time.monotonic() + _DEVIATION_EXPORT_TTL
+    return deviations
+
+
 def create_deviation(db: Session, deviation: DeviationCreate) -> Deviation:
     """Create a new deviation record"""
     db_deviation = Deviation(**deviation.dict())
     db.add(db_deviation)
     db.commit()
-    db.refresh(db_deviation)
+    invalidate_deviation_export_cache()
     return db_deviation
 
 
 # ==================== REPORT CRUD ====================
-def get_reports(db: Session, skip: int = 0, limit: int = 100, type: Optional[str] = None, state: Optional[str] = None) -> List[Report]:
-    """Get all reports with optional filtering by type and state"""
-    query = db.query(Report)
-    
+def get_reports(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    type: Optional[str] = None,
+    state: Optional[str] = None
+) -> Tuple[List[Report], Optional[str]]:
+    """Get all reports with optional filtering by type and state (keyset-paginated on generatedDate, id)"""
+    stmt = lambda_stmt(lambda: select(Report))
+
     # Apply type filter
     if type and type != 'all':
-        query = query.filter(Report.type.ilike(f"%{type}%"))
-    
+        type_pattern = f"%{type}%"
+        stmt += lambda s: s.where(Report.type.ilike(type_pattern))
+
     # Apply state filter (search in name for state-like content)
     if state and state != 'all':
-        query = query.filter(Report.name.ilike(f"%{state}%"))
-    
-    reports = query.order_by(Report.generatedDate.desc()).offset(skip).limit(limit).all()
-    
-    # Update status based on file existence for reports marked as "Generating"
+        state_pattern = f"%{state}%"
+        stmt += lambda s: s.where(Report.name.ilike(state_pattern))
+
+    if cursor:
+        parts = _decode_cursor(cursor, 2)
+        if parts:
+            try:
+                cur_date = _parse_date(parts[0])
+                cur_id = int(parts[1])
+            except ValueError:
+                pass
+            else:
+                stmt += lambda s: s.where(or_(
+                    Report.generatedDate < cur_date,
+                    and_(Report.generatedDate == cur_date, Report.id < cur_id)
+                ))
+    elif skip:
+        # Deprecated fallback for callers still sending offsets
+        stmt += lambda s: s.offset(skip)
+
+    stmt += lambda s: s.order_by(Report.generatedDate.desc(), Report.id.desc()).limit(limit)
+    reports = db.scalars(stmt).all()
+    
+    # Update status based on file existence for reports marked as "Generating".
+    # Statuses are flipped in one pass and flushed with a single commit - the
+    # previous per-row commit+refresh cost one fsync and one SELECT per report.
+    now = datetime.now()
+    changed = False
     for report in reports:
         if report.status == "Generating" and report.filePath:
             if os.path.exists(report.filePath):
                 report.status = "Ready"
-                db.commit()
-                db.refresh(report)
+                changed = True
             elif report.createdAt:
                 # If file doesn't exist and report is old (more than 5 minutes), mark as Failed
-                if (datetime.now() - report.createdAt).total_seconds() > 300:
+                if (now - report.createdAt).total_seconds() > 300:
                     report.status = "Failed"
-                    db.commit()
-                    db.refresh(report)
-    
-    return reports
+                    changed = True
+    if changed:
+        db.commit()
+
+    next_cursor = None
+    if len(reports) == limit:
+        last = reports[-1]
+        next_cursor = _encode_cursor(last.generatedDate.isoformat(), last.id)
+
+    return reports, next_cursor
 
 
 def get_report(db: Session, report_id: int) -> Optional[Report]:
     """Get a single report by ID"""
-    return db.query(Report).filter(Report.id == report_id).first()
+    return db.get(Report, report_id)
 
 
 def update_report(db: Session, report_id: int, filePath: Optional[str] = None, status: Optional[str] = None) -> Optional[Report]:
@@ -465,30 +712,39 @@ def create_report(db: Session, report: ReportCreate) -> Report:
     db_report = Report(**report.dict())
     db.add(db_report)
     db.commit()
-    db.refresh(db_report)
     return db_report
 
 
-def delete_report(db: Session, report_id: int) -> Dict[str, Any]:
-    """Delete a report and return structured response"""
+def delete_report(db: Session, report_id: int, remove_file: bool = True) -> Dict[str, Any]:
+    """Delete a report and return structured response.
+
+    With ``remove_file=False`` the associated file is left on disk and its
+    path is returned instead, so callers can defer the filesystem work
+    (e.g. to a background task) after the row is gone."""
     db_report = get_report(db, report_id)
     if not db_report:
         return {"success": False, "message": "Report not found", "id": report_id}
 
-    # Delete associated file if it exists
-    if db_report.filePath and os.path.exists(db_report.filePath):
+    file_path = db_report.filePath
+    if remove_file and file_path and os.path.exists(file_path):
         try:
-            os.remove(db_report.filePath)
+            os.remove(file_path)
         except OSError:
             pass  # Ignore file deletion errors
+        file_path = None
 
     # Store ID before deletion
     deleted_id = db_report.id
-    
+
     db.delete(db_report)
     db.commit()
-    
-    return {"success": True, "message": "Report deleted successfully", "id": deleted_id}
+
+    return {
+        "success": True,
+        "message": "Report deleted successfully",
+        "id": deleted_id,
+        "filePath": file_path,
+    }
 
 
 # ==================== TEMPLATE CRUD ====================
@@ -512,7 +768,7 @@ def get_templates(
 
 def get_template(db: Session, template_id: int) -> Optional[Template]:
     """Get a single template by ID"""
-    return db.query(Template).filter(Template.id == template_id).first()
+    return db.get(Template, template_id)
 
 
 def create_template(db: Session, template: TemplateCreate) -> Template:
@@ -520,61 +776,95 @@ def create_template(db: Session, template: TemplateCreate) -> Template:
     db_template = Template(**template.dict())
     db.add(db_template)
     db.commit()
-    db.refresh(db_template)
     return db_template
 
 
 def delete_template(db: Session, template_id: int) -> bool:
     """Delete a template"""
-    db_template = get_template(db, template_id)
-    if not db_template:
-        return False
-    
-    db.delete(db_template)
+    result = db.execute(delete(Template).where(Template.id == template_id))
     db.commit()
-    return True
+    return result.rowcount > 0
 
 
 # ==================== DASHBOARD STATS ====================
+# Dashboard stats are hit on every page refresh but the underlying data
+# changes at minute scale, so the computed dict is cached in-process for a
+# short TTL. Plant/schedule writes invalidate it immediately. Per-worker
+# cache: with multiple uvicorn workers each holds its own 30 s window.
+_DASHBOARD_STATS_TTL = 30.0
+_dashboard_stats_cache: Optional[Dict[str, Any]] = None
+_dashboard_stats_expiry = 0.0
+
+
+def invalidate_dashboard_stats_cache() -> None:
+    """Drop the cached dashboard stats after a plant/schedule write"""
+    global _dashboard_stats_cache, _dashboard_stats_expiry
+    _dashboard_stats_cache = None
+    _dashboard_stats_expiry = 0.0
+
+
 def get_dashboard_stats(db: Session) -> Dict[str, Any]:
     """Get dashboard statistics"""
+    global _dashboard_stats_cache, _dashboard_stats_expiry
+    if _dashboard_stats_cache is not None and time.monotonic() < _dashboard_stats_expiry:
+        return _dashboard_stats_cache
     try:
-        plants = db.query(Plant).all()
-        all_schedules = db.query(Schedule).all()
-        
-        # Filter schedules by status for the schedules object
-        pending_schedules = [s for s in all_schedules if s.status == "Pending"]
-        approved_schedules = [s for s in all_schedules if s.status == "Approved"]
-        revised_schedules = [s for s in all_schedules if s.status == "Revised"]
-        # Active schedules for generation calculation
-        active_schedules = [s for s in all_schedules if s.status == "Active"]
-        
-        active_plants = [p for p in plants if p.status == "Active"]
-        wind_plants = [p for p in active_plants if p.type == "Wind"]
-        solar_plants = [p for p in active_plants if p.type == "Solar"]
-        
-        # Handle null capacity values safely
-        total_capacity = sum(p.capacity or 0 for p in active_plants)
-        wind_capacity = sum(p.capacity or 0 for p in wind_plants)
-        solar_capacity = sum(p.capacity or 0 for p in solar_plants)
-        current_generation = sum(s.actual or 0 for s in active_schedules if s.actual)
-        
+        # Aggregate in SQL instead of hydrating every Plant/Schedule row and
+        # filtering in Python - the grouped results are a handful of rows.
+        plant_rows = db.query(
+            Plant.type,
+            Plant.status,
+            func.sum(func.coalesce(Plant.capacity, 0.0)),
+            func.count()
+        ).group_by(Plant.type, Plant.status).all()
+
+        schedule_rows = db.query(
+            Schedule.status,
+            func.sum(func.coalesce(Schedule.actual, 0.0)),
+            func.count()
+        ).group_by(Schedule.status).all()
+
+        active_plants = 0
+        total_capacity = wind_capacity = solar_capacity = 0.0
+        for plant_type, plant_status, capacity, count in plant_rows:
+            if plant_status == "Active":
+                active_plants += count
+                total_capacity += capacity or 0
+                if plant_type == "Wind":
+                    wind_capacity += capacity or 0
+                elif plant_type == "Solar":
+                    solar_capacity += capacity or 0
+
+        total_schedules = 0
+        current_generation = 0.0
+        status_counts = {"Pending": 0, "Approved": 0, "Revised": 0}
+        for schedule_status, actual_sum, count in schedule_rows:
+            total_schedules += count
+            if schedule_status in status_counts:
+                status_counts[schedule_status] = count
+            elif schedule_status == "Active":
+                # Active schedules drive the generation calculation
+                current_generation = actual_sum or 0
+
         efficiency = (current_generation / total_capacity * 100) if total_capacity > 0 else 0.0
-        
-        return {
-            "activePlants": len(active_plants),
+
+        stats = {
+            "activePlants": active_plants,
             "totalCapacity": round(total_capacity, 2),
             "currentGeneration": round(current_generation, 2),
             "efficiency": round(efficiency, 2),
             "windCapacity": round(wind_capacity, 2),
             "solarCapacity": round(solar_capacity, 2),
             "schedules": {
-                "total": len(all_schedules),
-                "pending": len(pending_schedules),
-                "approved": len(approved_schedules),
-                "revised": len(revised_schedules)
+                "total": total_schedules,
+                "pending": status_counts["Pending"],
+                "approved": status_counts["Approved"],
+                "revised": status_counts["Revised"]
             }
         }
+        _dashboard_stats_cache = stats
+        _dashboard_stats_expiry = time.monotonic() + _DASHBOARD_STATS_TTL
+        return stats
     except Exception as e:
         # Log the error for debugging
         print(f"Error in get_dashboard_stats: {str(e)}")
@@ -600,26 +890,52 @@ def get_whatsapp_data(
     db: Session,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     plant_id: Optional[int] = None,
     date: Optional[date] = None,
     status: Optional[str] = None
-) -> List[WhatsAppData]:
-    """Get all WhatsApp data with optional filtering"""
-    query = db.query(WhatsAppData)
-    
+) -> Tuple[List[WhatsAppData], Optional[str]]:
+    """Get all WhatsApp data with optional filtering (keyset-paginated on createdAt, id)"""
+    stmt = lambda_stmt(lambda: select(WhatsAppData))
+
     if plant_id:
-        query = query.filter(WhatsAppData.plantId == plant_id)
+        stmt += lambda s: s.where(WhatsAppData.plantId == plant_id)
     if date:
-        query = query.filter(WhatsAppData.date == date)
+        stmt += lambda s: s.where(WhatsAppData.date == date)
     if status:
-        query = query.filter(WhatsAppData.status == status)
-    
-    return query.order_by(WhatsAppData.createdAt.desc()).offset(skip).limit(limit).all()
+        stmt += lambda s: s.where(WhatsAppData.status == status)
+
+    if cursor:
+        parts = _decode_cursor(cursor, 2)
+        if parts:
+            try:
+                cur_created = datetime.fromisoformat(parts[0])
+                cur_id = int(parts[1])
+            except ValueError:
+                pass
+            else:
+                stmt += lambda s: s.where(or_(
+                    WhatsAppData.createdAt < cur_created,
+                    and_(WhatsAppData.createdAt == cur_created, WhatsAppData.id < cur_id)
+                ))
+    elif skip:
+        # Deprecated fallback for callers still sending offsets
+        stmt += lambda s: s.offset(skip)
+
+    stmt += lambda s: s.order_by(WhatsAppData.createdAt.desc(), WhatsAppData.id.desc()).limit(limit)
+    results = db.scalars(stmt).all()
+
+    next_cursor = None
+    if len(results) == limit:
+        last = results[-1]
+        next_cursor = _encode_cursor(last.createdAt.isoformat(), last.id)
+
+    return results, next_cursor
 
 
 def get_whatsapp_data_by_id(db: Session, whatsapp_id: int) -> Optional[WhatsAppData]:
     """Get a single WhatsApp data entry by ID"""
-    return db.query(WhatsAppData).filter(WhatsAppData.id == whatsapp_id).first()
+    return db.get(WhatsAppData, whatsapp_id)
 
 
 def create_whatsapp_data(db: Session, whatsapp_data: WhatsAppDataCreate) -> WhatsAppData:
@@ -627,34 +943,28 @@ def create_whatsapp_data(db: Session, whatsapp_data: WhatsAppDataCreate) -> What
     db_whatsapp = WhatsAppData(**whatsapp_data.dict())
     db.add(db_whatsapp)
     db.commit()
-    db.refresh(db_whatsapp)
     return db_whatsapp
 
 
 def update_whatsapp_data(db: Session, whatsapp_id: int, whatsapp_data: WhatsAppDataUpdate) -> Optional[WhatsAppData]:
     """Update a WhatsApp data entry"""
-    db_whatsapp = get_whatsapp_data_by_id(db, whatsapp_id)
-    if not db_whatsapp:
-        return None
-    
     update_data = whatsapp_data.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_whatsapp, key, value)
-    
+    if not update_data:
+        return get_whatsapp_data_by_id(db, whatsapp_id)
+
+    # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE
+    db_whatsapp = db.scalars(
+        update(WhatsAppData).where(WhatsAppData.id == whatsapp_id).values(**update_data).returning(WhatsAppData)
+    ).first()
     db.commit()
-    db.refresh(db_whatsapp)
     return db_whatsapp
 
 
 def delete_whatsapp_data(db: Session, whatsapp_id: int) -> bool:
     """Delete a WhatsApp data entry"""
-    db_whatsapp = get_whatsapp_data_by_id(db, whatsapp_id)
-    if not db_whatsapp:
-        return False
-    
-    db.delete(db_whatsapp)
+    result = db.execute(delete(WhatsAppData).where(WhatsAppData.id == whatsapp_id))
     db.commit()
-    return True
+    return result.rowcount > 0
 
 
 # ==================== METER DATA CRUD ====================
@@ -662,23 +972,51 @@ def get_meter_data(
     db: Session,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     plant_id: Optional[int] = None,
     data_date: Optional[date] = None
-) -> List[MeterData]:
-    """Get all meter data with optional filtering"""
-    query = db.query(MeterData)
-    
+) -> Tuple[List[MeterData], Optional[str]]:
+    """Get all meter data with optional filtering (keyset-paginated on dataDate, createdAt, id)"""
+    stmt = lambda_stmt(lambda: select(MeterData))
+
     if plant_id:
-        query = query.filter(MeterData.plantId == plant_id)
+        stmt += lambda s: s.where(MeterData.plantId == plant_id)
     if data_date:
-        query = query.filter(MeterData.dataDate == data_date)
-    
-    return query.order_by(MeterData.dataDate.desc(), MeterData.createdAt.desc()).offset(skip).limit(limit).all()
+        stmt += lambda s: s.where(MeterData.dataDate == data_date)
+
+    if cursor:
+        parts = _decode_cursor(cursor, 3)
+        if parts:
+            try:
+                cur_date = _parse_date(parts[0])
+                cur_created = datetime.fromisoformat(parts[1])
+                cur_id = int(parts[2])
+            except ValueError:
+                pass
+            else:
+                stmt += lambda s: s.where(or_(
+                    MeterData.dataDate < cur_date,
+                    and_(MeterData.dataDate == cur_date, MeterData.createdAt < cur_created),
+                    and_(MeterData.dataDate == cur_date, MeterData.createdAt == cur_created, MeterData.id < cur_id)
+                ))
+    elif skip:
+        # Deprecated fallback for callers still sending offsets
+        stmt += lambda s: s.offset(skip)
+
+    stmt += lambda s: s.order_by(MeterData.dataDate.desc(), MeterData.createdAt.desc(), MeterData.id.desc()).limit(limit)
+    results = db.scalars(stmt).all()
+
+    next_cursor = None
+    if len(results) == limit:
+        last = results[-1]
+        next_cursor = _encode_cursor(last.dataDate.isoformat(), last.createdAt.isoformat(), last.id)
+
+    return results, next_cursor
 
 
 def get_meter_data_by_id(db: Session, meter_id: int) -> Optional[MeterData]:
     """Get a single meter data entry by ID"""
-    return db.query(MeterData).filter(MeterData.id == meter_id).first()
+    return db.get(MeterData, meter_id)
 
 
 def get_latest_meter_data(db: Session, plant_id: int) -> Optional[MeterData]:
@@ -688,46 +1026,33 @@ def get_latest_meter_data(db: Session, plant_id: int) -> Optional[MeterData]:
 
 def create_meter_data(db: Session, meter_data: MeterDataCreate) -> MeterData:
     """Create a new meter data entry"""
-    # Convert blockData dict to JSON string
+    # blockData is a JSON/JSONB column - the dialect serializes the dict
     data_dict = meter_data.dict()
-    if isinstance(data_dict.get('blockData'), dict):
-        data_dict['blockData'] = json.dumps(data_dict['blockData'])
-    
     db_meter = MeterData(**data_dict)
     db.add(db_meter)
     db.commit()
-    db.refresh(db_meter)
     return db_meter
 
 
 def update_meter_data(db: Session, meter_id: int, meter_data: MeterDataUpdate) -> Optional[MeterData]:
     """Update a meter data entry"""
-    db_meter = get_meter_data_by_id(db, meter_id)
-    if not db_meter:
-        return None
-    
     update_data = meter_data.dict(exclude_unset=True)
-    # Convert blockData dict to JSON string if present
-    if 'blockData' in update_data and isinstance(update_data['blockData'], dict):
-        update_data['blockData'] = json.dumps(update_data['blockData'])
-    
-    for key, value in update_data.items():
-        setattr(db_meter, key, value)
-    
+    if not update_data:
+        return get_meter_data_by_id(db, meter_id)
+
+    # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE
+    db_meter = db.scalars(
+        update(MeterData).where(MeterData.id == meter_id).values(**update_data).returning(MeterData)
+    ).first()
     db.commit()
-    db.refresh(db_meter)
     return db_meter
 
 
 def delete_meter_data(db: Session, meter_id: int) -> bool:
     """Delete a meter data entry"""
-    db_meter = get_meter_data_by_id(db, meter_id)
-    if not db_meter:
-        return False
-    
-    db.delete(db_meter)
+    result = db.execute(delete(MeterData).where(MeterData.id == meter_id))
     db.commit()
-    return True
+    return result.rowcount > 0
 
 
 # Import new models for CRUD operations
@@ -753,7 +1078,7 @@ def get_schedule_readiness(
 
 def get_schedule_readiness_by_id(db: Session, readiness_id: int) -> Optional[ScheduleReadiness]:
     """Get a single schedule readiness record by ID"""
-    return db.query(ScheduleReadiness).filter(ScheduleReadiness.id == readiness_id).first()
+    return db.get(ScheduleReadiness, readiness_id)
 
 
 def get_schedule_readiness_by_plant(db: Session, plant_id: int) -> Optional[ScheduleReadiness]:
@@ -761,12 +1086,28 @@ def get_schedule_readiness_by_plant(db: Session, plant_id: int) -> Optional[Sche
     return db.query(ScheduleReadiness).filter(ScheduleReadiness.plant_id == plant_id).first()
 
 
+# The readiness summary is polled by the dashboard but only changes when a
+# readiness row is written (trigger sweep, manual revision, continue,
+# mark-ready); cache the computed payload for a short TTL and drop it on
+# every write - same pattern as the dashboard-stats cache. Per-worker.
+_READINESS_SUMMARY_TTL = 30.0
+_readiness_summary_cache: Optional[Dict[str, Any]] = None
+_readiness_summary_expiry = 0.0
+
+
+def invalidate_readiness_summary_cache() -> None:
+    """Drop the cached readiness summary after a readiness write"""
+    global _readiness_summary_cache, _readiness_summary_expiry
+    _readiness_summary_cache = None
+    _readiness_summary_expiry = 0.0
+
+
 def create_schedule_readiness(db: Session, readiness: Dict) -> ScheduleReadiness:
     """Create a new schedule readiness record"""
     db_readiness = ScheduleReadiness(**readiness)
     db.add(db_readiness)
     db.commit()
-    db.refresh(db_readiness)
+    invalidate_readiness_summary_cache()
     return db_readiness
 
 
@@ -775,50 +1116,66 @@ def update_schedule_readiness(db: Session, readiness_id: int, update_data: Dict)
     db_readiness = get_schedule_readiness_by_id(db, readiness_id)
     if not db_readiness:
         return None
-    
+
     for key, value in update_data.items():
         setattr(db_readiness, key, value)
-    
+
     db.commit()
     db.refresh(db_readiness)
+    invalidate_readiness_summary_cache()
     return db_readiness
 
 
 def get_schedule_readiness_summary(db: Session) -> Dict[str, Any]:
-    """Get summary of all plant readiness statuses"""
-    all_readiness = db.query(ScheduleReadiness).all()
-    
-    # Get all plants to ensure we have records for all
-    plants = db.query(Plant).all()
-    plant_ids = {p.id for p in plants}
-    readiness_plant_ids = {r.plant_id for r in all_readiness}
-    
-    # Create readiness records for plants that don't have them
-    for plant in plants:
-        if plant.id not in readiness_plant_ids:
-            db_readiness = ScheduleReadiness(
-                plant_id=plant.id,
-                plant_name=plant.name,
-                status="NO_ACTION",
-                schedule_date=date.today()
-            )
-            db.add(db_readiness)
-    
-    db.commit()
-    
-    # Refresh and get all
+    """Get summary of all plant readiness statuses (cached between writes)"""
+    global _readiness_summary_cache, _readiness_summary_expiry
+    if _readiness_summary_cache is not None and time.monotonic() < _readiness_summary_expiry:
+        return _readiness_summary_cache
+    summary = _compute_schedule_readiness_summary(db)
+    _readiness_summary_cache = summary
+    _readiness_summary_expiry = time.monotonic() + _READINESS_SUMMARY_TTL
+    return summary
+
+
+def _compute_schedule_readiness_summary(db: Session) -> Dict[str, Any]:
+    """Build the readiness summary payload"""
+    # Find plants without a readiness record via LEFT JOIN instead of loading
+    # both tables and diffing id sets in Python
+    missing = db.execute(
+        select(Plant.id, Plant.name)
+        .outerjoin(ScheduleReadiness, ScheduleReadiness.plant_id == Plant.id)
+        .where(ScheduleReadiness.id == None)
+    ).all()
+
+    if missing:
+        db.bulk_insert_mappings(ScheduleReadiness, [
+            {
+                "plant_id": plant_id,
+                "plant_name": plant_name,
+                "status": "NO_ACTION",
+                "schedule_date": date.today()
+            }
+            for plant_id, plant_name in missing
+        ])
+        db.commit()
+
     all_readiness = db.query(ScheduleReadiness).all()
-    
-    ready_count = len([r for r in all_readiness if r.status == "READY"])
-    pending_count = len([r for r in all_readiness if r.status == "PENDING"])
-    no_action_count = len([r for r in all_readiness if r.status == "NO_ACTION"])
-    
+
+    # One pass over the rows we already hold - no extra COUNT query and no
+    # throwaway filtered lists
+    status_counts = Counter(r.status for r in all_readiness)
+
     return {
         "total_plants": len(all_readiness),
-        "ready_count": ready_count,
-        "pending_count": pending_count,
-        "no_action_count": no_action_count,
-        "plants": all_readiness
+        "ready_count": status_counts.get("READY", 0),
+        "pending_count": status_counts.get("PENDING", 0),
+        "no_action_count": status_counts.get("NO_ACTION", 0),
+        # Plain dicts so the cached payload never holds ORM state tied to a
+        # finished session
+        "plants": [
+            {k: v for k, v in r.__dict__.items() if not k.startswith('_')}
+            for r in all_readiness
+        ]
     }
 
 
@@ -848,13 +1205,12 @@ def create_schedule_trigger(db: Session, trigger_data: Dict) -> ScheduleTrigger:
     db_trigger = ScheduleTrigger(**trigger_data)
     db.add(db_trigger)
     db.commit()
-    db.refresh(db_trigger)
     return db_trigger
 
 
 def acknowledge_schedule_trigger(db: Session, trigger_id: int) -> Optional[ScheduleTrigger]:
     """Acknowledge a schedule trigger"""
-    db_trigger = db.query(ScheduleTrigger).filter(ScheduleTrigger.id == trigger_id).first()
+    db_trigger = db.get(ScheduleTrigger, trigger_id)
     if not db_trigger:
         return None
     
@@ -866,7 +1222,7 @@ def acknowledge_schedule_trigger(db: Session, trigger_id: int) -> Optional[Sched
 
 def process_schedule_trigger(db: Session, trigger_id: int) -> Optional[ScheduleTrigger]:
     """Mark a schedule trigger as processed"""
-    db_trigger = db.query(ScheduleTrigger).filter(ScheduleTrigger.id == trigger_id).first()
+    db_trigger = db.get(ScheduleTrigger, trigger_id)
     if not db_trigger:
         return None
     
@@ -900,49 +1256,78 @@ def get_schedule_notifications(
 
 def get_schedule_notification_by_id(db: Session, notification_id: int) -> Optional[ScheduleNotification]:
     """Get a single schedule notification by ID"""
-    return db.query(ScheduleNotification).filter(ScheduleNotification.id == notification_id).first()
+    return db.get(ScheduleNotification, notification_id)
 
 
 def create_schedule_notification(db: Session, notification_data: Dict) -> ScheduleNotification:
     """Create a new schedule notification record"""
-    db_notification = ScheduleNotification(**notification_data)
-    db.add(db_notification)
+    # Single INSERT ... RETURNING round-trip; server defaults such as
+    # created_at come back with the row instead of needing a reload
+    db_notification = db.scalars(
+        insert(ScheduleNotification).values(**notification_data).returning(ScheduleNotification)
+    ).one()
     db.commit()
-    db.refresh(db_notification)
+    _invalidate_unread_count_cache(notification_data.get("plant_id"))
     return db_notification
 
 
 def mark_notification_read(db: Session, notification_id: int) -> Optional[ScheduleNotification]:
     """Mark a notification as read"""
-    db_notification = get_schedule_notification_by_id(db, notification_id)
-    if not db_notification:
-        return None
-    
-    db_notification.read = True
+    # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE + refresh
+    db_notification = db.scalars(
+        update(ScheduleNotification)
+        .where(ScheduleNotification.id == notification_id)
+        .values(read=True)
+        .returning(ScheduleNotification)
+    ).first()
     db.commit()
-    db.refresh(db_notification)
+    if db_notification is not None:
+        _invalidate_unread_count_cache(db_notification.plant_id)
     return db_notification
 
 
 def mark_all_notifications_read(db: Session, plant_id: Optional[int] = None) -> int:
     """Mark all notifications as read"""
-    query = db.query(ScheduleNotification).filter(ScheduleNotification.read == False)
-    
+    # One UPDATE scan; rowcount replaces the separate COUNT query and avoids
+    # the race between counting and updating
+    stmt = update(ScheduleNotification).where(ScheduleNotification.read == False)
+
     if plant_id:
-        query = query.filter(ScheduleNotification.plant_id == plant_id)
-    
-    count = query.count()
-    query.update({"read": True})
+        stmt = stmt.where(ScheduleNotification.plant_id == plant_id)
+
+    result = db.execute(stmt.values(read=True))
     db.commit()
-    
-    return count
+    _invalidate_unread_count_cache(plant_id)
+    return result.rowcount
+
+
+# Unread counts are polled on every page load but only change on writes;
+# cache per plant (None = all plants) for a few seconds, same approach as
+# the dashboard stats cache above
+_UNREAD_COUNT_TTL = 5.0
+_unread_count_cache: Dict[Optional[int], Tuple[int, float]] = {}
+
+
+def _invalidate_unread_count_cache(plant_id: Optional[int] = None) -> None:
+    """Drop cached unread counts after a notification write"""
+    if plant_id is None:
+        _unread_count_cache.clear()
+    else:
+        _unread_count_cache.pop(plant_id, None)
+        _unread_count_cache.pop(None, None)  # the all-plants total changed too
 
 
 def get_unread_notification_count(db: Session, plant_id: Optional[int] = None) -> int:
     """Get count of unread notifications"""
+    cached = _unread_count_cache.get(plant_id)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
     query = db.query(ScheduleNotification).filter(ScheduleNotification.read == False)
-    
+
     if plant_id:
         query = query.filter(ScheduleNotification.plant_id == plant_id)
-    
-    return query.count()
+
+    count = query.count()
+    _unread_count_cache[plant_id] = (count, time.monotonic() + _UNREAD_COUNT_TTL)
+    return count
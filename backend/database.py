@@ -1,8 +1,8 @@
 """
 Database configuration for PostgreSQL (version 15 compatible)
 """
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session
 import os
 
 # PostgreSQL Configuration
@@ -22,19 +22,57 @@ if DATABASE_URL.startswith("sqlite"):
 # Create PostgreSQL engine with connection pooling
 # pool_size: number of connections to maintain
 # max_overflow: additional connections allowed beyond pool_size
+# pool_timeout: seconds to wait for a free connection before erroring
 # pool_pre_ping: verify connections before use
 # pool_recycle: recycle connections after this many seconds
+# Sizes are env-configurable; keep pool_size + max_overflow per worker
+# below PostgreSQL max_connections / worker count.
 engine = create_engine(
     DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "30")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "50")),
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    # Pre-ping costs a SELECT 1 round-trip on every checkout; TCP keepalives
+    # below catch dead connections instead. Set DB_POOL_PRE_PING=true to
+    # re-enable on flaky networks.
+    pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
     pool_recycle=3600,
+    # The handful of hot statements (plant by id, readiness upsert, list
+    # queries) should never fall out of the SQL compilation cache; the
+    # default 500 is tight once every model's CRUD variants are counted
+    query_cache_size=1200,
+    # psycopg2 rewrites executemany INSERTs into multi-row VALUES batches
+    # (execute_values); bulk_insert_mappings in the seed script and readiness
+    # backfill get COPY-like throughput without raw cursor code
+    executemany_mode="values_plus_batch",
+    connect_args={
+        # Session parameters applied by the server at connection startup -
+        # no extra round-trips on each new connection. Only parameters
+        # PgBouncer tracks may appear here (timezone is; statement_timeout
+        # is not and would make PgBouncer reject the connection) - the
+        # statement timeout is set server-side in docker-compose instead
+        "options": "-c timezone=UTC",
+        # Keepalives detect dead peers without per-checkout probing
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 5,
+    },
     echo=False  # Set to True for debugging SQL queries
 )
 
-# Session factory with autoflush and autocommit disabled
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session factory with autoflush and autocommit disabled.
+# expire_on_commit=False keeps attributes loaded after commit: sessions are
+# per-request, so nothing can go stale, and create endpoints can serialize
+# the returned row without a refresh SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Thread-scoped session for read-only endpoints: handlers run on the
+# threadpool, so each worker thread reuses one Session object across
+# requests instead of constructing and tearing one down per request.
+# get_read_db ends the transaction (releasing the pooled connection and
+# expiring cached state) without discarding the Session itself.
+ReadSession = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
 # Base class for all models
 Base = declarative_base()
@@ -49,20 +87,22 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """Dependency for read-only endpoints: thread-scoped session reuse.
+
+    Only for GETs that never write - mutations should keep get_db so each
+    request has its own transaction lifecycle."""
+    db = ReadSession()
+    try:
+        yield db
+    finally:
+        # Ends the (read) transaction: connection goes back to the pool and
+        # loaded objects expire, but the Session is kept for the next request
+        db.rollback()
+
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
     return engine
 
-
-# PostgreSQL-specific optimizations
-@event.listens_for(engine, "connect")
-def set_session_vars(dbapi_connection, connection_record):
-    """Set PostgreSQL session variables for better performance"""
-    cursor = dbapi_connection.cursor()
-    # Set timezone to UTC
-    cursor.execute("SET timezone = 'UTC'")
-    # Enable extended query protocol for better performance
-    cursor.execute("SET statement_timeout = '60s'")
-    cursor.close()
-
@@ -4,13 +4,20 @@ Initialize database with sample data - PostgreSQL compatible version
 from database import SessionLocal, engine, Base
 from models import Plant, Schedule, Forecast, Weather, Deviation, Report, Template, WhatsAppData, MeterData
 from datetime import date, datetime, timedelta
-import json
 import os
 import math
 import random
 
+import numpy as np
+
 # Create all tables
 print("Creating database tables...")
+if engine.dialect.name == "postgresql":
+    # pg_trgm backs the trigram index on plants.name
+    from sqlalchemy import text
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.commit()
 Base.metadata.create_all(bind=engine)
 
 db = SessionLocal()
@@ -20,221 +27,241 @@ try:
     if db.query(Plant).count() > 0:
         print("Database already initialized with data.")
         exit(0)
-    
+
     print("Seeding sample data...")
-    
-    # Create sample plants
+
+    # Bulk inserts throughout: plain dicts + bulk_insert_mappings send one
+    # multi-row INSERT per table and skip per-object unit-of-work tracking,
+    # instead of a round-trip per db.add()/commit()
     plants = [
-        Plant(
-            name="Wind Farm Alpha",
-            type="Wind",
-            capacity=500.0,
-            state="Maharashtra",
-            status="Active",
-            efficiency=78.5
-        ),
-        Plant(
-            name="Solar Park Beta",
-            type="Solar",
-            capacity=300.0,
-            state="Gujarat",
-            status="Active",
-            efficiency=82.3
-        ),
-        Plant(
-            name="Wind Farm Gamma",
-            type="Wind",
-            capacity=450.0,
-            state="Tamil Nadu",
-            status="Maintenance",
-            efficiency=65.2
-        ),
-        Plant(
-            name="Solar Plant Delta",
-            type="Solar",
-            capacity=250.0,
-            state="Rajasthan",
-            status="Active",
-            efficiency=75.8
-        ),
-        Plant(
-            name="Wind Farm Epsilon",
-            type="Wind",
-            capacity=600.0,
-            state="Maharashtra",
-            status="Active",
-            efficiency=80.2
-        ),
-        Plant(
-            name="Solar Plant Zeta",
-            type="Solar",
-            capacity=350.0,
-            state="Gujarat",
-            status="Active",
-            efficiency=85.1
-        ),
+        {
+            "name": "Wind Farm Alpha",
+            "type": "Wind",
+            "capacity": 500.0,
+            "state": "Maharashtra",
+            "status": "Active",
+            "efficiency": 78.5,
+        },
+        {
+            "name": "Solar Park Beta",
+            "type": "Solar",
+            "capacity": 300.0,
+            "state": "Gujarat",
+            "status": "Active",
+            "efficiency": 82.3,
+        },
+        {
+            "name": "Wind Farm Gamma",
+            "type": "Wind",
+            "capacity": 450.0,
+            "state": "Tamil Nadu",
+            "status": "Maintenance",
+            "efficiency": 65.2,
+        },
+        {
+            "name": "Solar Plant Delta",
+            "type": "Solar",
+            "capacity": 250.0,
+            "state": "Rajasthan",
+            "status": "Active",
+            "efficiency": 75.8,
+        },
+        {
+            "name": "Wind Farm Epsilon",
+            "type": "Wind",
+            "capacity": 600.0,
+            "state": "Maharashtra",
+            "status": "Active",
+            "efficiency": 80.2,
+        },
+        {
+            "name": "Solar Plant Zeta",
+            "type": "Solar",
+            "capacity": 350.0,
+            "state": "Gujarat",
+            "status": "Active",
+            "efficiency": 85.1,
+        },
     ]
-    
-    for plant in plants:
-        db.add(plant)
-    db.commit()
+    db.bulk_insert_mappings(Plant, plants)
     print(f"Created {len(plants)} plants")
-    
+
     # Create sample schedules
     schedules = [
-        Schedule(
-            plantName="Wind Farm Alpha",
-            type="Day-Ahead",
-            scheduleDate=date.today(),
-            capacity=500.0,
-            forecasted=380.0,
-            actual=372.0,
-            status="Active",
-            deviation=-2.1
-        ),
-        Schedule(
-            plantName="Solar Park Beta",
-            type="Intraday",
-            scheduleDate=date.today(),
-            capacity=300.0,
-            forecasted=245.0,
-            actual=251.0,
-            status="Completed",
-            deviation=2.4
-        ),
+        {
+            "plantName": "Wind Farm Alpha",
+            "type": "Day-Ahead",
+            "scheduleDate": date.today(),
+            "capacity": 500.0,
+            "forecasted": 380.0,
+            "actual": 372.0,
+            "status": "Active",
+            "deviation": -2.1,
+        },
+        {
+            "plantName": "Solar Park Beta",
+            "type": "Intraday",
+            "scheduleDate": date.today(),
+            "capacity": 300.0,
+            "forecasted": 245.0,
+            "actual": 251.0,
+            "status": "Completed",
+            "deviation": 2.4,
+        },
     ]
-    
-    for schedule in schedules:
-        db.add(schedule)
-    db.commit()
+    db.bulk_insert_mappings(Schedule, schedules)
     print(f"Created {len(schedules)} schedules")
-    
+
     # Create sample weather data
-    weather = Weather(
-        location="Maharashtra",
-        temperature=28.5,
-        humidity=65.0,
-        windSpeed=12.3,
-        cloudCover=35.0,
-        pressure=1013.0,
-        visibility=10.0,
-        forecast=json.dumps({"7-day": "forecast available"})
-    )
-    db.add(weather)
-    db.commit()
+    db.bulk_insert_mappings(Weather, [{
+        "location": "Maharashtra",
+        "temperature": 28.5,
+        "humidity": 65.0,
+        "windSpeed": 12.3,
+        "cloudCover": 35.0,
+        "pressure": 1013.0,
+        "visibility": 10.0,
+        "forecast": {"7-day": "forecast available"},
+    }])
     print("Created weather data")
-    
+
     # Create sample deviations
-    for i in range(24):
-        deviation = Deviation(
-            hour=i,
-            deviation=round((i % 10 - 5) * 0.5, 2),
-            forecasted=200 + (i * 10),
-            actual=200 + (i * 10) + (i % 5 - 2) * 5,
-            plantId=1
-        )
-        db.add(deviation)
-    db.commit()
+    deviation_rows = [
+        {
+            "hour": i,
+            "deviation": round((i % 10 - 5) * 0.5, 2),
+            "forecasted": 200 + (i * 10),
+            "actual": 200 + (i * 10) + (i % 5 - 2) * 5,
+            "plantId": 1,
+        }
+        for i in range(24)
+    ]
+    db.bulk_insert_mappings(Deviation, deviation_rows)
     print("Created 24 deviation records")
-    
+
     # Create sample templates
     templates = [
-        Template(
-            name="Standard Day-Ahead Template",
-            vendor="NLDC",
-            type="Day-Ahead",
-            lastModified=date.today() - timedelta(days=4),
-            status="Active"
-        ),
-        Template(
-            name="Intraday Schedule Template",
-            vendor="RLDC",
-            type="Intraday",
-            lastModified=date.today() - timedelta(days=6),
-            status="Active"
-        ),
+        {
+            "name": "Standard Day-Ahead Template",
+            "vendor": "NLDC",
+            "type": "Day-Ahead",
+            "lastModified": date.today() - timedelta(days=4),
+            "status": "Active",
+        },
+        {
+            "name": "Intraday Schedule Template",
+            "vendor": "RLDC",
+            "type": "Intraday",
+            "lastModified": date.today() - timedelta(days=6),
+            "status": "Active",
+        },
     ]
-    
-    for template in templates:
-        db.add(template)
-    db.commit()
+    db.bulk_insert_mappings(Template, templates)
     print(f"Created {len(templates)} templates")
-    
+
+    # No intermediate commit: the plant ids are visible to queries within
+    # the same transaction, and a single commit at the end means one fsync
+    # for the whole seed instead of one per table.
+
     # Create sample meter data for each plant
-    # Generate 96 blocks of 15-minute interval data
+    # Generate 96 blocks of 15-minute interval data; the per-block math is
+    # vectorized with numpy so each plant is one array computation instead
+    # of 96 interpreter iterations
+    blocks = np.arange(96)
+    hours = blocks // 4
+    minutes = (blocks % 4) * 15
+    time_strs = [f"{h:02d}:{m:02d}" for h, m in zip(hours, minutes)]
+
     all_plants = db.query(Plant).all()
+    meter_rows = []
     for plant in all_plants:
         is_solar = plant.type == "Solar"
-        block_data = {}
-        total_generation = 0
-        
-        for i in range(96):
-            hour = i // 4
-            minute = (i % 4) * 15
-            time_str = f"{hour:02d}:{minute:02d}"
-            
-            if is_solar:
-                # Solar: Peak at noon, zero at night
-                if 6 <= hour <= 18:
-                    solar_progress = (hour - 6 + minute / 60) / 12
-                    generation = max(0, round(math.sin(solar_progress * math.pi) * plant.capacity * 0.7, 2))
-                else:
-                    generation = 0
-            else:
-                # Wind: Variable throughout day
-                wind_base = plant.capacity * 0.3 + math.sin((i / 96) * 2 * math.pi - math.pi / 2) * plant.capacity * 0.2
-                generation = max(0, round(wind_base + random.uniform(-10, 10), 2))
-            
-            block_data[f"block_{i + 1}"] = {
+
+        if is_solar:
+            # Solar: Peak at noon, zero at night
+            solar_progress = (hours - 6 + minutes / 60) / 12
+            generation = np.where(
+                (hours >= 6) & (hours <= 18),
+                np.sin(solar_progress * np.pi) * plant.capacity * 0.7,
+                0.0
+            )
+        else:
+            # Wind: Variable throughout day
+            wind_base = plant.capacity * 0.3 + np.sin((blocks / 96) * 2 * np.pi - np.pi / 2) * plant.capacity * 0.2
+            generation = wind_base + np.random.uniform(-10, 10, 96)
+        generation = np.maximum(0, generation.round(2)).tolist()
+
+        availability = (90 + np.random.uniform(0, 10, 96)).round(1).tolist()
+        block_data = {
+            f"block_{i + 1}": {
                 "block": i + 1,
-                "time": time_str,
-                "generation": generation,
+                "time": time_strs[i],
+                "generation": generation[i],
                 "availableCapacity": 90 if is_solar else 95,
-                "availability": round(90 + random.uniform(0, 10), 1)
+                "availability": availability[i]
             }
-            total_generation += generation
-        
-        meter_data = MeterData(
-            plantId=plant.id,
-            plantName=plant.name,
-            dataDate=date.today(),
-            blockData=json.dumps(block_data),
-            source="SCADA",
-            lastReading=datetime.now(),
-            dataPoints=96,
-            delay=random.randint(5, 15)
-        )
-        db.add(meter_data)
-    db.commit()
+            for i in range(96)
+        }
+
+        meter_rows.append({
+            "plantId": plant.id,
+            "plantName": plant.name,
+            "dataDate": date.today(),
+            "blockData": block_data,
+            "source": "SCADA",
+            "lastReading": datetime.now(),
+            "dataPoints": 96,
+            "delay": random.randint(5, 15),
+        })
+    db.bulk_insert_mappings(MeterData, meter_rows)
     print(f"Created meter data for {len(all_plants)} plants")
-    
-    # Create sample WhatsApp data for each plant
-    for plant in db.query(Plant).all():
-        # Create 3-5 entries per plant
-        for i in range(random.randint(3, 5)):
-            whatsapp_entry = WhatsAppData(
-                plantId=plant.id,
-                plantName=plant.name,
-                state=plant.state,
-                date=date.today() - timedelta(days=i),
-                time=f"{random.randint(8, 18)}:{random.choice(['00', '15', '30', '45'])}",
-                currentGeneration=round(plant.capacity * random.uniform(0.3, 0.8), 1),
-                expectedTrend=random.choice(["Increasing", "Stable", "Decreasing"]),
-                curtailmentStatus=random.random() > 0.8,
-                curtailmentReason=random.choice(["Grid Constraint", "Weather", "Maintenance", None]) if random.random() > 0.8 else None,
-                weatherCondition=random.choice(["Clear", "Partly Cloudy", "Cloudy", "Sudden Change"]),
-                inverterAvailability=round(random.uniform(85, 99), 1),
-                remarks=f"Regular update - {plant.type} plant operating normally",
-                status=random.choice(["Pending Review", "Reviewed", "Used"])
-            )
-            db.add(whatsapp_entry)
+
+    # Create sample WhatsApp data for each plant (3-5 entries each).
+    # All random draws come from one numpy Generator in batch arrays instead
+    # of several Python-RNG calls per row.
+    rng = np.random.default_rng()
+    entries_per_plant = rng.integers(3, 6, len(all_plants))
+    n = int(entries_per_plant.sum())
+
+    hours_col = rng.integers(8, 19, n)
+    minutes_col = rng.choice(["00", "15", "30", "45"], n)
+    gen_fraction = rng.uniform(0.3, 0.8, n)
+    trends = rng.choice(["Increasing", "Stable", "Decreasing"], n)
+    curtailed = rng.random(n) > 0.8
+    has_reason = rng.random(n) > 0.8
+    reasons = rng.choice(["Grid Constraint", "Weather", "Maintenance", None], n)
+    weather_conditions = rng.choice(["Clear", "Partly Cloudy", "Cloudy", "Sudden Change"], n)
+    inverter_avail = rng.uniform(85, 99, n).round(1)
+    statuses = rng.choice(["Pending Review", "Reviewed", "Used"], n)
+
+    whatsapp_rows = []
+    idx = 0
+    for plant, entry_count in zip(all_plants, entries_per_plant):
+        for i in range(entry_count):
+            whatsapp_rows.append({
+                "plantId": plant.id,
+                "plantName": plant.name,
+                "state": plant.state,
+                "date": date.today() - timedelta(days=i),
+                "time": f"{hours_col[idx]}:{minutes_col[idx]}",
+                "currentGeneration": round(plant.capacity * gen_fraction[idx], 1),
+                "expectedTrend": str(trends[idx]),
+                "curtailmentStatus": bool(curtailed[idx]),
+                "curtailmentReason": str(reasons[idx]) if has_reason[idx] and reasons[idx] is not None else None,
+                "weatherCondition": str(weather_conditions[idx]),
+                "inverterAvailability": float(inverter_avail[idx]),
+                "remarks": f"Regular update - {plant.type} plant operating normally",
+                "status": str(statuses[idx]),
+            })
+            idx += 1
+    db.bulk_insert_mappings(WhatsAppData, whatsapp_rows)
     db.commit()
     print("Created WhatsApp data entries")
-    
+
     print("=" * 50)
     print("Database initialized successfully with sample data!")
     print("=" * 50)
-    
+
 except Exception as e:
     print(f"Error initializing database: {e}")
     import traceback
@@ -242,4 +269,3 @@ except Exception as e:
     db.rollback()
 finally:
     db.close()
-
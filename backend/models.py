@@ -1,7 +1,8 @@
 """
 SQLAlchemy database models
 """
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, Boolean, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from database import Base
 
@@ -21,6 +22,16 @@ class Plant(Base):
     location_name = Column(String(255), nullable=True)  # Human-readable location name
     lastUpdated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Covers the combined state/type/status filters in list_plants
+        Index("ix_plants_state_type_status", state, type, status),
+        # Trigram GIN index accelerates the ILIKE '%term%' name search on
+        # PostgreSQL (needs the pg_trgm extension, created at startup);
+        # other dialects ignore the postgresql_* kwargs
+        Index("ix_plants_name_trgm", name,
+              postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
+
 
 class Schedule(Base):
     __tablename__ = "schedules"
@@ -34,9 +45,18 @@ class Schedule(Base):
     actual = Column(Float, default=0.0)
     status = Column(String(50), default="Pending")  # Pending, Approved, Revised, Completed
     deviation = Column(Float, default=0.0)
-    blockData = Column(Text, nullable=True)  # JSON string of 96 time blocks
+    # 96 time blocks; JSONB on PostgreSQL so rows come back pre-parsed
+    blockData = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     createdAt = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Backs keyset pagination ordered by (scheduleDate DESC, id DESC); the
+    # composite with plantName serves the plant-filtered listing without a
+    # second filter pass over the date index
+    __table_args__ = (
+        Index("ix_schedules_schedule_date_id", scheduleDate.desc(), id.desc()),
+        Index("ix_schedules_plant_name_date_id", plantName, scheduleDate.desc(), id.desc()),
+    )
+
 
 class Forecast(Base):
     __tablename__ = "forecasts"
@@ -45,7 +65,8 @@ class Forecast(Base):
     plantId = Column(Integer, nullable=False, index=True)
     plantName = Column(String(255), nullable=False)
     forecastDate = Column(Date, nullable=False, index=True)
-    hourlyData = Column(Text)  # JSON string of hourly forecast data
+    # Hourly forecast data; JSONB on PostgreSQL so rows come back pre-parsed
+    hourlyData = Column(JSON().with_variant(JSONB(), "postgresql"))
     createdAt = Column(DateTime(timezone=True), server_default=func.now())
 
 
@@ -60,7 +81,8 @@ class Weather(Base):
     cloudCover = Column(Float)
     pressure = Column(Float)
     visibility = Column(Float)
-    forecast = Column(Text)  # JSON string of forecast data
+    # Forecast data; JSONB on PostgreSQL so rows come back pre-parsed
+    forecast = Column(JSON().with_variant(JSONB(), "postgresql"))
     lastUpdated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
@@ -89,6 +111,13 @@ class Report(Base):
     filePath = Column(String(500), nullable=True)
     createdAt = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Backs keyset pagination ordered by (generatedDate DESC, id DESC);
+    # the partial index serves the "Generating" status sweep in get_reports
+    __table_args__ = (
+        Index("ix_reports_generated_date_id", generatedDate.desc(), id.desc()),
+        Index("ix_reports_generating", id, postgresql_where=(status == "Generating")),
+    )
+
 
 class Template(Base):
     __tablename__ = "templates"
@@ -123,6 +152,14 @@ class WhatsAppData(Base):
     createdAt = Column(DateTime(timezone=True), server_default=func.now())
     updatedAt = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Backs keyset pagination ordered by (createdAt DESC, id DESC); the
+    # plant-leading composite serves the latest-row-per-plant lookup in the
+    # curtailment check as a straight index walk
+    __table_args__ = (
+        Index("ix_whatsapp_data_created_at_id", createdAt.desc(), id.desc()),
+        Index("ix_whatsapp_data_plant_created_at", plantId, createdAt.desc()),
+    )
+
 
 class MeterData(Base):
     __tablename__ = "meter_data"
@@ -131,7 +168,9 @@ class MeterData(Base):
     plantId = Column(Integer, nullable=False, index=True)
     plantName = Column(String(255), nullable=False)
     dataDate = Column(Date, nullable=False, index=True)
-    blockData = Column(Text, nullable=False)  # JSON string of 96 blocks (15-min intervals)
+    # 96 blocks (15-min intervals); JSONB on PostgreSQL so rows come back
+    # pre-parsed instead of costing a json.loads per row in every endpoint
+    blockData = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
     source = Column(String(50), default="SCADA")  # SCADA, Manual Upload
     lastReading = Column(DateTime(timezone=True), nullable=True)
     dataPoints = Column(Integer, default=96)  # Number of data points
@@ -139,6 +178,14 @@ class MeterData(Base):
     createdAt = Column(DateTime(timezone=True), server_default=func.now())
     updatedAt = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Backs keyset pagination ordered by (dataDate DESC, createdAt DESC, id
+    # DESC); the plant-leading composite serves latest-row-per-plant lookups
+    # (get_latest_meter_data, the readiness sweep) as a straight index walk
+    __table_args__ = (
+        Index("ix_meter_data_data_date_created_at_id", dataDate.desc(), createdAt.desc(), id.desc()),
+        Index("ix_meter_data_plant_date_created_at", plantId, dataDate.desc(), createdAt.desc()),
+    )
+
 
 class ScheduleReadiness(Base):
     """Track schedule readiness status per site"""
@@ -157,6 +204,12 @@ class ScheduleReadiness(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Serves the status-filtered listing and any due-date sweep in one
+    # index range scan
+    __table_args__ = (
+        Index("ix_schedule_readiness_status_next_check", status, next_check_due),
+    )
+
 
 class ScheduleTrigger(Base):
     """Track trigger events that may cause schedule revision"""
@@ -173,6 +226,12 @@ class ScheduleTrigger(Base):
     processed = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Unprocessed triggers are the selective working set for readiness checks
+    __table_args__ = (
+        Index("ix_schedule_triggers_unprocessed", plant_id, created_at.desc(),
+              postgresql_where=(processed == False)),
+    )
+
 
 class ScheduleNotification(Base):
     """Store notifications for operators"""
@@ -189,3 +248,14 @@ class ScheduleNotification(Base):
     action_required = Column(Boolean, default=True)
     deadline = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Unread rows are the hot set for count/mark-all queries; the partial
+    # index stays tiny and serves them as index-only scans. The composite
+    # covers the per-plant dedup lookup (plant_id + type + recent created_at)
+    # in the trigger-notification path
+    __table_args__ = (
+        Index("ix_schedule_notifications_unread", plant_id,
+              postgresql_where=(read == False)),
+        Index("ix_schedule_notifications_plant_type_created", plant_id,
+              notification_type, created_at.desc()),
+    )
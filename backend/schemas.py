@@ -1,10 +1,12 @@
 """
 Pydantic schemas for request/response validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
 
+import orjson
+
 
 # Plant Schemas
 class PlantBase(BaseModel):
@@ -39,8 +41,7 @@ class PlantResponse(PlantBase):
     id: int
     lastUpdated: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Schedule Schemas
@@ -94,24 +95,13 @@ class ScheduleResponse(ScheduleBase):
     createdAt: Optional[datetime] = None
     blockData: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
-    
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("blockData", mode="before")
     @classmethod
-    def from_orm(cls, obj):
-        # Call parent from_orm first
-        result = super().from_orm(obj)
-        # Convert blockData from JSON string to dict if needed
-        if hasattr(obj, 'blockData') and obj.blockData:
-            try:
-                import json
-                if isinstance(obj.blockData, str):
-                    result.blockData = json.loads(obj.blockData)
-                elif isinstance(obj.blockData, dict):
-                    result.blockData = obj.blockData
-            except (json.JSONDecodeError, TypeError):
-                result.blockData = None
-        return result
+    def _parse_block_data(cls, v):
+        # Legacy rows written before the JSON column migration hold strings
+        return orjson.loads(v) if isinstance(v, (str, bytes)) else v
 
 
 # Forecast Schemas
@@ -130,8 +120,7 @@ class ForecastResponse(ForecastBase):
     id: int
     createdAt: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Weather Schemas
@@ -154,8 +143,7 @@ class WeatherResponse(WeatherBase):
     id: int
     lastUpdated: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Deviation Schemas
@@ -175,8 +163,7 @@ class DeviationResponse(DeviationBase):
     id: int
     createdAt: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Report Schemas
@@ -198,8 +185,7 @@ class ReportResponse(ReportBase):
     id: int
     createdAt: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Template Schemas
@@ -220,8 +206,7 @@ class TemplateResponse(TemplateBase):
     id: int
     createdAt: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Dashboard Stats Schema
@@ -271,8 +256,7 @@ class WhatsAppDataResponse(WhatsAppDataBase):
     createdAt: Optional[datetime] = None
     updatedAt: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Meter Data Schemas
@@ -303,8 +287,13 @@ class MeterDataResponse(MeterDataBase):
     createdAt: Optional[datetime] = None
     updatedAt: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("blockData", mode="before")
+    @classmethod
+    def _parse_block_data(cls, v):
+        # Legacy rows written before the JSON column migration hold strings
+        return orjson.loads(v) if isinstance(v, (str, bytes)) else v
 
 
 # ==================== SCHEDULE READINESS SCHEMAS ====================
@@ -337,8 +326,7 @@ class ScheduleReadinessResponse(ScheduleReadinessBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ScheduleReadinessSummary(BaseModel):
@@ -370,8 +358,7 @@ class ScheduleTriggerResponse(ScheduleTriggerBase):
     processed: bool
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ==================== SCHEDULE NOTIFICATION SCHEMAS ====================
@@ -400,8 +387,7 @@ class ScheduleNotificationResponse(ScheduleNotificationBase):
     deadline: Optional[datetime] = None
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NotificationListResponse(BaseModel):
@@ -2,18 +2,21 @@
 Schedule Readiness Service
 Handles site-wise asynchronous schedule preparation logic
 """
-import json
 import math
+
+import numpy as np
+import orjson
 from datetime import datetime, date, timedelta
 from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import ScheduleReadiness, ScheduleTrigger, ScheduleNotification, Plant, MeterData, Weather, WhatsAppData
+from crud import invalidate_readiness_summary_cache
 
 
 class ScheduleReadinessService:
@@ -32,24 +35,156 @@ class ScheduleReadinessService:
         """
         Check all plants for schedule readiness triggers.
         Returns summary of status counts.
+
+        Batched: one SELECT per table up front (readiness rows, latest
+        meter/whatsapp row per plant, weather, recent notifications) and a
+        single commit at the end, instead of re-running the per-plant
+        check_plant_readiness with its several queries and commits each -
+        round-trips drop from O(plants) to a handful.
         """
-        plants = self.db.query(Plant).all()
-        
+        db = self.db
+        # One clock read for the whole pass: every timestamp and window
+        # predicate below binds the same instant
+        now = datetime.now()
+        plants = db.query(Plant).all()
+
         status_counts = {
             'READY': 0,
             'PENDING': 0,
             'NO_ACTION': 0
         }
-        
+        if not plants:
+            return status_counts
+
+        plant_ids = [p.id for p in plants]
+        readiness_by_plant = {
+            r.plant_id: r for r in db.query(ScheduleReadiness).filter(
+                ScheduleReadiness.plant_id.in_(plant_ids)
+            )
+        }
+        meter_by_plant = {
+            m.plantId: m for m in self._latest_per_plant(
+                MeterData, MeterData.plantId,
+                (MeterData.dataDate.desc(), MeterData.createdAt.desc())
+            )
+        }
+        whatsapp_by_plant = {
+            w.plantId: w for w in self._latest_per_plant(
+                WhatsAppData, WhatsAppData.plantId,
+                (WhatsAppData.createdAt.desc(),)
+            )
+        }
+        weather_by_location = {
+            w.location: w for w in db.query(Weather).filter(
+                Weather.location.in_([f"Plant_{pid}" for pid in plant_ids])
+            )
+        }
+        # Plants already notified in the last hour - mirrors the per-plant
+        # dedup in _create_notification
+        recently_notified = {
+            row[0] for row in db.query(ScheduleNotification.plant_id).filter(
+                ScheduleNotification.notification_type == "Trigger Alert",
+                ScheduleNotification.created_at > now - timedelta(hours=1)
+            ).distinct()
+        }
+
+        # New rows are accumulated and flushed as one bulk INSERT per table;
+        # existing rows dropping to NO_ACTION share identical values, so that
+        # bucket becomes a single UPDATE ... WHERE id IN (...) instead of one
+        # UPDATE per row
+        new_readiness_rows = []
+        new_triggers = []
+        new_notifications = []
+        no_action_ids = []
+
         for plant in plants:
-            self.check_plant_readiness(plant.id)
-            # Get updated status
-            readiness = self.get_plant_readiness(plant.id)
-            if readiness:
-                status_counts[readiness.status] += 1
-        
-        self.db.commit()
+            # Evaluate triggers against the prefetched rows - no queries
+            # inside the loop
+            active_triggers = [t for t in (
+                self._weather_trigger_from(plant.id, plant.type,
+                                           weather_by_location.get(f"Plant_{plant.id}")),
+                self._curtailment_trigger_from(plant.id, whatsapp_by_plant.get(plant.id)),
+                self._deviation_trigger_from(plant.id, meter_by_plant.get(plant.id), now=now),
+            ) if t]
+            new_triggers.extend(active_triggers)
+
+            has_updated_files = self._check_schedule_files(plant.id)
+            new_status = self._determine_status(has_updated_files, bool(active_triggers))
+
+            trigger_reason = None
+            if new_status == "PENDING" and active_triggers:
+                # dict.fromkeys dedups in evaluation order, so the reason
+                # string is deterministic (sets are not)
+                trigger_reason = ", ".join(dict.fromkeys(t.trigger_type for t in active_triggers))
+                if plant.id not in recently_notified:
+                    new_notifications.append(
+                        self._build_trigger_notification(plant.id, plant.name, active_triggers[0]))
+                    recently_notified.add(plant.id)
+
+            readiness = readiness_by_plant.get(plant.id)
+            if not readiness:
+                row = {
+                    "plant_id": plant.id,
+                    "plant_name": plant.name,
+                    "status": new_status,
+                    "schedule_date": date.today(),
+                    "last_checked": now,
+                    "trigger_reason": trigger_reason,
+                }
+                if new_status == "READY":
+                    row["upload_deadline"] = now + timedelta(hours=self.UPLOAD_DEADLINE_HOURS)
+                    row["revision_number"] = 1
+                    new_notifications.append(
+                        self._build_ready_notification(plant.id, plant.name, row["upload_deadline"]))
+                new_readiness_rows.append(row)
+            elif new_status == "NO_ACTION":
+                no_action_ids.append(readiness.id)
+            else:
+                old_status = readiness.status
+                readiness.status = new_status
+                readiness.last_checked = now
+                readiness.trigger_reason = trigger_reason
+
+                if new_status == "READY" and old_status != "READY":
+                    readiness.upload_deadline = now + timedelta(hours=self.UPLOAD_DEADLINE_HOURS)
+                    readiness.revision_number = (readiness.revision_number or 0) + 1
+                    new_notifications.append(
+                        self._build_ready_notification(plant.id, plant.name, readiness.upload_deadline))
+
+            status_counts[new_status] += 1
+
+        if new_readiness_rows:
+            db.bulk_insert_mappings(ScheduleReadiness, new_readiness_rows)
+        if new_triggers:
+            db.bulk_insert_mappings(ScheduleTrigger, [self._insert_mapping(t) for t in new_triggers])
+        if new_notifications:
+            db.bulk_insert_mappings(ScheduleNotification, [self._insert_mapping(n) for n in new_notifications])
+        if no_action_ids:
+            # synchronize_session=False skips the in-Python identity-map
+            # sweep; nothing reads these rows again before the commit expires
+            # them
+            db.execute(
+                update(ScheduleReadiness)
+                .where(ScheduleReadiness.id.in_(no_action_ids))
+                .values(status="NO_ACTION", last_checked=now, trigger_reason=None)
+                .execution_options(synchronize_session=False)
+            )
+
+        db.commit()
+        invalidate_readiness_summary_cache()
         return status_counts
+
+    @staticmethod
+    def _insert_mapping(obj):
+        """Set attributes of an unsaved ORM object as a bulk-insert mapping"""
+        return {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
+
+    def _latest_per_plant(self, model, plant_col, order_by):
+        """Latest row of *model* per plant in one query (window function)"""
+        rn = func.row_number().over(partition_by=plant_col, order_by=order_by).label("rn")
+        sub = select(model.id.label("id"), rn).subquery()
+        latest_ids = select(sub.c.id).where(sub.c.rn == 1)
+        return self.db.query(model).filter(model.id.in_(latest_ids)).all()
     
     def check_plant_readiness(self, plant_id: int) -> ScheduleReadiness:
         """
@@ -60,10 +195,15 @@ class ScheduleReadinessService:
         2. Check for triggers (weather, curtailment, deviation)
         3. Update status accordingly
         """
-        plant = self.db.query(Plant).filter(Plant.id == plant_id).first()
+        # Column select: the check only needs id/name/type, so skip
+        # materializing a full ORM instance
+        plant = self.db.query(Plant.id, Plant.name, Plant.type).filter(Plant.id == plant_id).first()
         if not plant:
             return None
-        
+
+        # One clock read for the whole pass
+        now = datetime.now()
+
         # Get existing readiness or create new
         readiness = self.db.query(ScheduleReadiness).filter(
             ScheduleReadiness.plant_id == plant_id
@@ -77,13 +217,11 @@ class ScheduleReadinessService:
                 schedule_date=date.today()
             )
             self.db.add(readiness)
-            self.db.commit()
-            self.db.refresh(readiness)
-        
+
         # Check for triggers
-        weather_trigger = self._check_weather_change(plant_id)
+        weather_trigger = self._check_weather_change(plant)
         curtailment_trigger = self._check_curtailment(plant_id)
-        deviation_trigger = self._check_deviation(plant_id)
+        deviation_trigger = self._check_deviation(plant_id, now=now)
         
         # Collect active triggers
         active_triggers = [t for t in [weather_trigger, curtailment_trigger, deviation_trigger] if t]
@@ -98,23 +236,25 @@ class ScheduleReadinessService:
         # Determine trigger reason if status is PENDING
         trigger_reason = None
         if new_status == "PENDING" and active_triggers:
-            trigger_types = list(set([t.trigger_type for t in active_triggers]))
-            trigger_reason = ", ".join(trigger_types)
+            # Order-preserving dedup keeps the reason string deterministic
+            trigger_reason = ", ".join(dict.fromkeys(t.trigger_type for t in active_triggers))
             
-            # Create notifications for triggers
-            for trigger in active_triggers:
-                self._create_notification(plant_id, plant.name, trigger)
-        
+            # One notification (and one dedup lookup) per pass - the hourly
+            # dedup collapsed the per-trigger loop to a single row anyway
+            self._create_notification(plant_id, plant.name, active_triggers[0], now=now)
+
         # Update readiness record
         old_status = readiness.status
         readiness.status = new_status
-        readiness.last_checked = datetime.now()
+        readiness.last_checked = now
         readiness.trigger_reason = trigger_reason
-        
+
         # If status changed to READY, set upload deadline
         if new_status == "READY" and old_status != "READY":
-            readiness.upload_deadline = datetime.now() + timedelta(hours=self.UPLOAD_DEADLINE_HOURS)
-            readiness.revision_number = readiness.revision_number + 1
+            readiness.upload_deadline = now + timedelta(hours=self.UPLOAD_DEADLINE_HOURS)
+            # Unflushed new rows still have revision_number None - the column
+            # default only applies at INSERT
+            readiness.revision_number = (readiness.revision_number or 0) + 1
             
             # Create notification for READY status
             self._create_ready_notification(plant_id, plant.name, readiness.upload_deadline)
@@ -122,10 +262,14 @@ class ScheduleReadinessService:
         # If status changed to NO_ACTION, clear trigger reason
         if new_status == "NO_ACTION":
             readiness.trigger_reason = None
-        
+
+        # Single commit for the whole pass: the _check_*/_create_* helpers
+        # only db.add(); one fsync instead of up to six per plant. No refresh
+        # needed - callers read attributes assigned above, and anything else
+        # lazy-loads on access after the commit expires the row
         self.db.commit()
-        self.db.refresh(readiness)
-        
+        invalidate_readiness_summary_cache()
+
         return readiness
     
     def _check_schedule_files(self, plant_id: int) -> bool:
@@ -141,52 +285,47 @@ class ScheduleReadinessService:
         # This would be replaced with actual file system check
         return False
     
-    def _check_deviation(self, plant_id: int) -> Optional[ScheduleTrigger]:
-        """
-        Check meter data for significant deviations.
-        
-        Uses meter data for CURRENT block only.
-        Returns trigger if deviation exceeds threshold.
+    def _deviation_trigger_from(self, plant_id: int, meter_data: Optional[MeterData],
+                                now: Optional[datetime] = None) -> Optional[ScheduleTrigger]:
+        """Evaluate the deviation rule against an already-fetched meter row.
+
+        Uses meter data for CURRENT block only. Returns an unsaved trigger
+        if deviation exceeds threshold; touches no session state.
         """
-        # Get latest meter data
-        meter_data = self.db.query(MeterData).filter(
-            MeterData.plantId == plant_id
-        ).order_by(MeterData.dataDate.desc(), MeterData.createdAt.desc()).first()
-        
         if not meter_data:
             return None
-        
-        # Parse block data
+
+        # Parse block data (legacy rows may still hold a JSON string)
         try:
-            block_data = json.loads(meter_data.blockData) if isinstance(meter_data.blockData, str) else meter_data.blockData
-        except (json.JSONDecodeError, TypeError):
+            block_data = orjson.loads(meter_data.blockData) if isinstance(meter_data.blockData, str) else meter_data.blockData
+        except (orjson.JSONDecodeError, TypeError):
             return None
-        
+
         if not block_data:
             return None
-        
-        # Get current time block (now)
-        current_hour = datetime.now().hour
-        current_minute = (datetime.now().minute // 15) * 15
-        current_block_key = f"block_{current_hour * 4 + current_minute // 15 + 1}"
-        
+
+        # Get current time block (callers checking many plants pass one
+        # shared snapshot so every plant evaluates the same block)
+        if now is None:
+            now = datetime.now()
+        current_block_key = _BLOCK_KEYS[now.hour * 4 + now.minute // 15]
+
         current_block = block_data.get(current_block_key, {})
-        
+
         if not current_block:
             return None
-        
+
         # Calculate deviation
         generation = current_block.get('generation', 0)
         scheduled = current_block.get('scheduled', 0)
-        
+
         if scheduled == 0:
             return None
-        
+
         deviation_percent = ((generation - scheduled) / scheduled) * 100
-        
+
         if abs(deviation_percent) >= self.DEVIATION_THRESHOLD:
-            # Create trigger record
-            trigger = ScheduleTrigger(
+            return ScheduleTrigger(
                 plant_id=plant_id,
                 trigger_type="Deviation",
                 severity="HIGH" if abs(deviation_percent) >= 20 else "MEDIUM",
@@ -194,52 +333,48 @@ class ScheduleReadinessService:
                 threshold_value=self.DEVIATION_THRESHOLD,
                 actual_value=deviation_percent
             )
-            self.db.add(trigger)
-            self.db.commit()
-            
-            return trigger
-        
+
         return None
+
+    def _check_deviation(self, plant_id: int, now: Optional[datetime] = None) -> Optional[ScheduleTrigger]:
+        """Fetch the latest meter row and evaluate the deviation rule"""
+        meter_data = self.db.query(MeterData).filter(
+            MeterData.plantId == plant_id
+        ).order_by(MeterData.dataDate.desc(), MeterData.createdAt.desc()).first()
+
+        trigger = self._deviation_trigger_from(plant_id, meter_data, now=now)
+        if trigger:
+            self.db.add(trigger)
+        return trigger
     
-    def _check_weather_change(self, plant_id: int) -> Optional[ScheduleTrigger]:
-        """
-        Check for significant weather forecast changes.
-        
-        Uses forecast data for FUTURE blocks.
-        Returns trigger if change exceeds threshold.
+    def _weather_trigger_from(self, plant_id: int, plant_type: str, weather: Optional[Weather]) -> Optional[ScheduleTrigger]:
+        """Evaluate the weather rule against an already-fetched weather row.
+
+        Uses forecast data for FUTURE blocks. Returns an unsaved trigger if
+        change exceeds threshold; touches no session state.
         """
-        # Get current weather
-        weather = self.db.query(Weather).filter(
-            Weather.location == f"Plant_{plant_id}"
-        ).first()
-        
         if not weather:
             return None
-        
+
         # Parse forecast data
         try:
-            forecast_data = json.loads(weather.forecast) if isinstance(weather.forecast, str) else weather.forecast
-        except (json.JSONDecodeError, TypeError):
+            forecast_data = orjson.loads(weather.forecast) if isinstance(weather.forecast, str) else weather.forecast
+        except (orjson.JSONDecodeError, TypeError):
             return None
-        
+
         if not forecast_data:
             return None
-        
-        # Get plant type to determine relevant weather parameter
-        plant = self.db.query(Plant).filter(Plant.id == plant_id).first()
-        if not plant:
-            return None
-        
-        if plant.type == "Wind":
+
+        if plant_type == "Wind":
             # Check wind speed change
             current_wind = weather.windSpeed or 0
             forecast_wind = forecast_data.get('windSpeed', current_wind)
-            
+
             if forecast_wind > 0:
                 wind_change = ((forecast_wind - current_wind) / current_wind) * 100 if current_wind > 0 else 0
-                
+
                 if abs(wind_change) >= self.WEATHER_CHANGE_THRESHOLD:
-                    trigger = ScheduleTrigger(
+                    return ScheduleTrigger(
                         plant_id=plant_id,
                         trigger_type="Weather",
                         severity="HIGH" if abs(wind_change) >= 25 else "MEDIUM",
@@ -247,19 +382,16 @@ class ScheduleReadinessService:
                         threshold_value=self.WEATHER_CHANGE_THRESHOLD,
                         actual_value=wind_change
                     )
-                    self.db.add(trigger)
-                    self.db.commit()
-                    return trigger
         else:
             # Solar - check cloud cover change
             current_cloud = weather.cloudCover or 0
             forecast_cloud = forecast_data.get('cloudCover', current_cloud)
-            
+
             if current_cloud > 0:
                 cloud_change = ((forecast_cloud - current_cloud) / current_cloud) * 100
-                
+
                 if abs(cloud_change) >= self.WEATHER_CHANGE_THRESHOLD:
-                    trigger = ScheduleTrigger(
+                    return ScheduleTrigger(
                         plant_id=plant_id,
                         trigger_type="Weather",
                         severity="HIGH" if abs(cloud_change) >= 25 else "MEDIUM",
@@ -267,39 +399,45 @@ class ScheduleReadinessService:
                         threshold_value=self.WEATHER_CHANGE_THRESHOLD,
                         actual_value=cloud_change
                     )
-                    self.db.add(trigger)
-                    self.db.commit()
-                    return trigger
-        
+
         return None
-    
+
+    def _check_weather_change(self, plant: Plant) -> Optional[ScheduleTrigger]:
+        """Fetch the plant's weather row and evaluate the weather rule"""
+        weather = self.db.query(Weather).filter(
+            Weather.location == f"Plant_{plant.id}"
+        ).first()
+
+        trigger = self._weather_trigger_from(plant.id, plant.type, weather)
+        if trigger:
+            self.db.add(trigger)
+        return trigger
+
+    def _curtailment_trigger_from(self, plant_id: int, whatsapp_data: Optional[WhatsAppData]) -> Optional[ScheduleTrigger]:
+        """Evaluate the curtailment rule against an already-fetched row.
+
+        Returns an unsaved trigger if curtailment is active."""
+        if not whatsapp_data or not whatsapp_data.curtailmentStatus:
+            return None
+
+        return ScheduleTrigger(
+            plant_id=plant_id,
+            trigger_type="Curtailment",
+            severity="CRITICAL",
+            description=f"Curtailment active: {whatsapp_data.curtailmentReason or 'No reason specified'}",
+            actual_value=1
+        )
+
     def _check_curtailment(self, plant_id: int) -> Optional[ScheduleTrigger]:
-        """
-        Check for curtailment signals.
-        
-        Returns trigger if curtailment is active.
-        """
-        # Check WhatsApp data for curtailment status
+        """Fetch the latest WhatsApp row and evaluate the curtailment rule"""
         whatsapp_data = self.db.query(WhatsAppData).filter(
             WhatsAppData.plantId == plant_id
         ).order_by(WhatsAppData.createdAt.desc()).first()
-        
-        if not whatsapp_data:
-            return None
-        
-        if whatsapp_data.curtailmentStatus:
-            trigger = ScheduleTrigger(
-                plant_id=plant_id,
-                trigger_type="Curtailment",
-                severity="CRITICAL",
-                description=f"Curtailment active: {whatsapp_data.curtailmentReason or 'No reason specified'}",
-                actual_value=1
-            )
+
+        trigger = self._curtailment_trigger_from(plant_id, whatsapp_data)
+        if trigger:
             self.db.add(trigger)
-            self.db.commit()
-            return trigger
-        
-        return None
+        return trigger
     
     def _determine_status(
         self,
@@ -325,46 +463,51 @@ class ScheduleReadinessService:
         self,
         plant_id: int,
         plant_name: str,
-        trigger: ScheduleTrigger
+        trigger: ScheduleTrigger,
+        now: Optional[datetime] = None
     ) -> ScheduleNotification:
         """Create notification for a trigger event"""
+        if now is None:
+            now = datetime.now()
         # Check if notification already exists for this trigger
         existing = self.db.query(ScheduleNotification).filter(
             ScheduleNotification.plant_id == plant_id,
             ScheduleNotification.notification_type == "Trigger Alert",
-            ScheduleNotification.created_at > datetime.now() - timedelta(hours=1)
+            ScheduleNotification.created_at > now - timedelta(hours=1)
         ).first()
         
         if existing:
             return existing
-        
-        title_map = {
-            "Weather": "Weather Change Detected",
-            "Curtailment": "Curtailment Signal Active",
-            "Deviation": "Meter Deviation Detected"
-        }
-        
-        message_map = {
-            "Weather": f"Weather forecast change detected for {plant_name}. Schedule revision may be required.",
-            "Curtailment": f"Curtailment signal active for {plant_name}. {trigger.description}",
-            "Deviation": f"Meter deviation of {trigger.actual_value:.1f}% detected for {plant_name}."
-        }
-        
-        notification = ScheduleNotification(
+
+        notification = self._build_trigger_notification(plant_id, plant_name, trigger)
+        self.db.add(notification)
+
+        return notification
+
+    def _build_trigger_notification(
+        self,
+        plant_id: int,
+        plant_name: str,
+        trigger: ScheduleTrigger
+    ) -> ScheduleNotification:
+        """Build (without saving) the notification for a trigger event"""
+        template = _MESSAGE_TEMPLATES.get(trigger.trigger_type)
+        message = template.format(
+            name=plant_name,
+            desc=trigger.description,
+            val=trigger.actual_value or 0
+        ) if template else trigger.description
+
+        return ScheduleNotification(
             plant_id=plant_id,
             plant_name=plant_name,
             notification_type="Trigger Alert",
-            title=title_map.get(trigger.trigger_type, "Trigger Detected"),
-            message=message_map.get(trigger.trigger_type, trigger.description),
+            title=_TITLE_MAP.get(trigger.trigger_type, "Trigger Detected"),
+            message=message,
             priority="HIGH" if trigger.severity in ["HIGH", "CRITICAL"] else "NORMAL",
             action_required=True
         )
-        
-        self.db.add(notification)
-        self.db.commit()
-        
-        return notification
-    
+
     def _create_ready_notification(
         self,
         plant_id: int,
@@ -372,7 +515,19 @@ class ScheduleReadinessService:
         deadline: datetime
     ) -> ScheduleNotification:
         """Create notification when schedule becomes READY"""
-        notification = ScheduleNotification(
+        notification = self._build_ready_notification(plant_id, plant_name, deadline)
+        self.db.add(notification)
+
+        return notification
+
+    def _build_ready_notification(
+        self,
+        plant_id: int,
+        plant_name: str,
+        deadline: datetime
+    ) -> ScheduleNotification:
+        """Build (without saving) the READY-status notification"""
+        return ScheduleNotification(
             plant_id=plant_id,
             plant_name=plant_name,
             notification_type="Schedule Ready",
@@ -382,11 +537,6 @@ class ScheduleReadinessService:
             action_required=True,
             deadline=deadline
         )
-        
-        self.db.add(notification)
-        self.db.commit()
-        
-        return notification
     
     def trigger_manual_revision(
         self,
@@ -394,6 +544,11 @@ class ScheduleReadinessService:
         reason: str = "Manual Trigger"
     ) -> ScheduleReadiness:
         """Manually trigger schedule revision for a plant"""
+        # Validate the plant before adding anything to the session, so a bad
+        # id early-returns instead of leaving a pending orphan trigger
+        if self.db.query(Plant.id).filter(Plant.id == plant_id).first() is None:
+            return None
+
         # Create a manual trigger
         trigger = ScheduleTrigger(
             plant_id=plant_id,
@@ -410,8 +565,8 @@ class ScheduleReadinessService:
     
     def continue_existing_schedule(self, plant_id: int) -> ScheduleReadiness:
         """Continue with existing (day-ahead) schedule - clears triggers"""
-        plant = self.db.query(Plant).filter(Plant.id == plant_id).first()
-        if not plant:
+        # Only existence matters here; a one-column select is enough
+        if self.db.query(Plant.id).filter(Plant.id == plant_id).first() is None:
             return None
         
         # Acknowledge all triggers for this plant
@@ -421,7 +576,7 @@ class ScheduleReadinessService:
         ).update({
             "acknowledged": True,
             "processed": True
-        })
+        }, synchronize_session=False)
         
         # Update readiness to NO_ACTION
         readiness = self.db.query(ScheduleReadiness).filter(
@@ -434,6 +589,7 @@ class ScheduleReadinessService:
             readiness.last_checked = datetime.now()
             self.db.commit()
             self.db.refresh(readiness)
+            invalidate_readiness_summary_cache()
         
         return readiness
     
@@ -443,7 +599,7 @@ class ScheduleReadinessService:
         upload_deadline: Optional[datetime] = None
     ) -> ScheduleReadiness:
         """Mark schedule as ready for upload"""
-        plant = self.db.query(Plant).filter(Plant.id == plant_id).first()
+        plant = self.db.query(Plant.id, Plant.name).filter(Plant.id == plant_id).first()
         if not plant:
             return None
         
@@ -461,7 +617,7 @@ class ScheduleReadinessService:
         
         readiness.status = "READY"
         readiness.upload_deadline = upload_deadline or (datetime.now() + timedelta(hours=self.UPLOAD_DEADLINE_HOURS))
-        readiness.revision_number = readiness.revision_number + 1
+        readiness.revision_number = (readiness.revision_number or 0) + 1
         readiness.last_checked = datetime.now()
         
         # Create notification
@@ -469,7 +625,8 @@ class ScheduleReadinessService:
         
         self.db.commit()
         self.db.refresh(readiness)
-        
+        invalidate_readiness_summary_cache()
+
         return readiness
     
     def get_plant_readiness(self, plant_id: int) -> Optional[ScheduleReadiness]:
@@ -530,8 +687,8 @@ def calculate_block_deviation(
     Uses meter data for CURRENT block.
     Uses forecast data for FUTURE blocks.
     """
-    block_key = f"block_{block_number}"
-    
+    block_key = _BLOCK_KEYS[block_number - 1]
+
     meter_block = meter_data.get(block_key, {})
     forecast_block = forecast_data.get(block_key, {})
     
@@ -560,40 +717,31 @@ def generate_revision_schedule(
     - Normal sites: Continue existing schedule
     - Exception sites: Generate new schedule
     """
+    # Vectorized over all 96 blocks: one array multiply/round instead of
+    # per-block Python arithmetic. Only the first 4 blocks get the weather
+    # adjustment and real meter actuals; the rest are forecast-only.
+    forecast_arr = np.fromiter(
+        (forecast_data.get(k, {}).get('forecast', 0) for k in _BLOCK_KEYS),
+        dtype=np.float64, count=96
+    )
+    scheduled = forecast_arr.copy()
+    if weather_data:
+        scheduled[:4] *= weather_data.get('adjustment_factor', 1.0)
+    scheduled = np.round(scheduled, 2)
+
     block_data = {}
-    
-    for i in range(1, 97):  # 96 blocks
-        block_key = f"block_{i}"
-        
-        if i <= 4:  # Current/future blocks - use forecast + weather
-            forecast = forecast_data.get(block_key, {}).get('forecast', 0)
-            scheduled = forecast
-            
-            # Apply weather adjustment if available
-            if weather_data:
-                weather_factor = weather_data.get('adjustment_factor', 1.0)
-                scheduled = scheduled * weather_factor
-            
-            block_data[block_key] = {
-                'block': i,
-                'time': _get_block_time(i),
-                'forecast': forecast,
-                'actual': current_meter_data.get(block_key, {}).get('generation', forecast),
-                'scheduled': round(scheduled, 2),
-                'source': 'forecast'
-            }
-        else:  # Future blocks - use forecast only
-            forecast = forecast_data.get(block_key, {}).get('forecast', 0)
-            
-            block_data[block_key] = {
-                'block': i,
-                'time': _get_block_time(i),
-                'forecast': forecast,
-                'actual': 0,
-                'scheduled': round(forecast, 2),
-                'source': 'forecast'
-            }
-    
+    for i, (forecast, sched) in enumerate(zip(forecast_arr.tolist(), scheduled.tolist()), start=1):
+        block_key = _BLOCK_KEYS[i - 1]
+        block_data[block_key] = {
+            'block': i,
+            'time': _BLOCK_TIMES[i - 1],
+            'forecast': forecast,
+            'actual': (current_meter_data.get(block_key, {}).get('generation', forecast)
+                       if i <= 4 else 0),
+            'scheduled': sched,
+            'source': 'forecast'
+        }
+
     return {
         'plant_id': plant_id,
         'schedule_date': date.today().isoformat(),
@@ -603,9 +751,30 @@ def generate_revision_schedule(
     }
 
 
+# Notification titles and message templates per trigger type, built once
+# at import; templates are formatted lazily so only the selected message
+# is rendered per notification
+_TITLE_MAP = {
+    "Weather": "Weather Change Detected",
+    "Curtailment": "Curtailment Signal Active",
+    "Deviation": "Meter Deviation Detected"
+}
+
+_MESSAGE_TEMPLATES = {
+    "Weather": "Weather forecast change detected for {name}. Schedule revision may be required.",
+    "Curtailment": "Curtailment signal active for {name}. {desc}",
+    "Deviation": "Meter deviation of {val:.1f}% detected for {name}."
+}
+
+# HH:MM label per 15-minute block, built once at import
+_BLOCK_TIMES = tuple(f"{(i - 1) // 4:02d}:{((i - 1) % 4) * 15:02d}" for i in range(1, 97))
+
+# "block_1".."block_96" dict keys, built once at import; indexed by
+# (hour * 4 + minute // 15) for the current block
+_BLOCK_KEYS = tuple(f"block_{i}" for i in range(1, 97))
+
+
 def _get_block_time(block_number: int) -> str:
     """Convert block number to time string (HH:MM)"""
-    hour = (block_number - 1) // 4
-    minute = ((block_number - 1) % 4) * 15
-    return f"{hour:02d}:{minute:02d}"
+    return _BLOCK_TIMES[block_number - 1]
 
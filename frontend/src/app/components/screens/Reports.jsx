@@ -46,7 +46,9 @@ const generatePDFReport = async (reportType, dateFrom, dateTo, filters = {}) =>
     const plantsResponse = await fetch(`${API_BASE_URL}/plants`);
     if (plantsResponse.ok) {
       const plants = await plantsResponse.json();
-      const plantsList = Array.isArray(plants) ? plants : [];
+      // Backend returns a {data, next_cursor} envelope
+      const plantsList = Array.isArray(plants) ? plants
+        : (Array.isArray(plants?.data) ? plants.data : []);
       reportData.plants = plantsList.map(p => ({
         name: p.name,
         type: p.type,
@@ -65,7 +67,9 @@ const generatePDFReport = async (reportType, dateFrom, dateTo, filters = {}) =>
     const schedulesResponse = await fetch(`${API_BASE_URL}/schedules?limit=100`);
     if (schedulesResponse.ok) {
       const schedules = await schedulesResponse.json();
-      const schedulesList = Array.isArray(schedules) ? schedules : [];
+      // Backend returns a {data, next_cursor} envelope
+      const schedulesList = Array.isArray(schedules) ? schedules
+        : (Array.isArray(schedules?.data) ? schedules.data : []);
       reportData.schedules = schedulesList;
     }
     
@@ -127,8 +127,11 @@ const mockApi = {
           if (filters.state && filters.state !== 'All States') params.append('state', filters.state);
           
           const response = await fetchWithError(`${API_BASE_URL}/plants?${params}`);
-          // FastAPI returns array directly
-          const plants = Array.isArray(response) ? response : [];
+          // Backend returns a {data, next_cursor} envelope; keep the bare-array
+          // guard for older backends
+          const plants = Array.isArray(response) ? response
+            : (Array.isArray(response?.data) ? response.data : []);
+          const nextCursor = response?.next_cursor ?? null;
           const plantsWithUpdate = plants.map(p => ({
             ...p,
             lastUpdate: p.lastUpdated ? new Date(p.lastUpdated).toLocaleString() : 'Unknown'
@@ -145,6 +148,7 @@ const mockApi = {
           return {
             plants: plantsWithUpdate,
             total: plantsWithUpdate.length,
+            nextCursor: nextCursor,
             stats: {
               totalPlants: plantsWithUpdate.length,
               totalCapacity: totalCapacity,
@@ -307,8 +311,11 @@ const mockApi = {
           params.append('limit', '10');
           
           const response = await fetchWithError(`${API_BASE_URL}/schedules?${params}`);
-          // FastAPI returns array directly - already limited by backend to 10
-          const schedules = Array.isArray(response) ? response : [];
+          // Backend returns a {data, next_cursor} envelope (already limited to
+          // 10); keep the bare-array guard for older backends
+          const schedules = Array.isArray(response) ? response
+            : (Array.isArray(response?.data) ? response.data : []);
+          const nextCursor = response?.next_cursor ?? null;
           // Ensure we don't exceed 10 (backend should already limit, but double-check)
           const limitedSchedules = schedules.slice(0, 10);
           return {
@@ -333,7 +340,8 @@ const mockApi = {
                 blockData: s.blockData || null
               };
             }),
-            total: limitedSchedules.length
+            total: limitedSchedules.length,
+            nextCursor: nextCursor
           };
         } catch (error) {
           console.warn('Backend API failed, using mock data:', error);
@@ -669,7 +677,11 @@ const mockApi = {
           if (filters.limit) params.append('limit', filters.limit.toString());
           
           const response = await fetchWithError(`${API_BASE_URL}/reports?${params}`);
-          const reports = Array.isArray(response) ? response : [];
+          // Backend returns a {data, next_cursor} envelope; keep the bare-array
+          // guard for older backends
+          const reports = Array.isArray(response) ? response
+            : (Array.isArray(response?.data) ? response.data : []);
+          const nextCursor = response?.next_cursor ?? null;
           
           // Transform backend report data to frontend format with proper date handling
           return {
@@ -745,7 +757,8 @@ const mockApi = {
               const dateA = new Date(a.createdAt || a.generatedDate || 0);
               const dateB = new Date(b.createdAt || b.generatedDate || 0);
               return dateB - dateA;
-            })
+            }),
+            nextCursor: nextCursor
           };
         } catch (error) {
           console.warn('Backend API failed for reports, using mock data:', error);
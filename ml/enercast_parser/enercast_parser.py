@@ -1,18 +1,75 @@
-import pandas as pd
+import os
+from functools import lru_cache
 
-def parse_enercast_csv(file_path):
+# pandas/numpy are imported lazily inside the functions that need them:
+# importing this module for get_value/get_shape style helpers should not
+# pay the several-hundred-ms pandas import on interpreter startup.
+
+
+def parse_enercast_csv(file_path, columns=None, dtype=None):
     """
     Reads Enercast CSV file and converts it into
     a matrix-like Pandas DataFrame.
+
+    `columns` restricts parsing to the listed column indices, and
+    `dtype` skips pandas' type-inference pass when the caller knows
+    the layout (e.g. dtype=np.float32 for pure-numeric exports) -
+    both cut the read time on wide files.
     """
+    import pandas as pd
+
     df = pd.read_csv(
         file_path,
         skiprows=6,
-        header=None
+        header=None,
+        usecols=columns,
+        dtype=dtype,
+        engine="c",
+        memory_map=True
     )
     return df
 
 
+@lru_cache(maxsize=32)
+def _read_preview(file_path, mtime, rows):
+    """
+    Cached preview parse; mtime is part of the key so a rewritten
+    file invalidates its cached entry automatically.
+    """
+    import pandas as pd
+
+    return pd.read_csv(
+        file_path,
+        skiprows=6,
+        header=None,
+        nrows=rows
+    )
+
+
+def preview_enercast_csv(file_path, rows=5):
+    """
+    Reads only the first `rows` data rows for a quick preview.
+    nrows stops the parser early, so preview latency does not
+    grow with file size; repeat previews of the same unchanged
+    file are served from an in-process cache.
+    """
+    return _read_preview(file_path, os.path.getmtime(file_path), rows)
+
+
+def preview_enercast_records(file_path, rows=5):
+    """
+    Preview as a list of JSON-safe dicts. NaN/Inf are replaced with
+    None in one vectorized pass instead of a per-scalar Python check.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = preview_enercast_csv(file_path, rows)
+    clean = df.replace([np.inf, -np.inf], np.nan)
+    clean = clean.astype(object).where(pd.notna(clean), None)
+    return clean.to_dict(orient="records")
+
+
 def get_value(df, row, col):
     """
     Returns a specific value from the matrix
@@ -1,12 +1,12 @@
 import os
-import json
+import orjson
 
 # Automatically get the JSON file path relative to this script
 JSON_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "windy_raw.json")
 
-# Load dummy JSON
-with open(JSON_FILE, "r") as f:
-    data = json.load(f)
+# Load dummy JSON - binary read + orjson skips the text-mode UTF-8 decode
+with open(JSON_FILE, "rb") as f:
+    data = orjson.loads(f.read())
 
 print("Dummy Windy API data loaded successfully!")
 print(data)
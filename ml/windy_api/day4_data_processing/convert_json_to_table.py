@@ -1,18 +1,19 @@
-import json
+import numpy as np
+import orjson
 import pandas as pd
 
 # JSON file path (correct for your folder structure)
 JSON_FILE = "../data/windy_raw.json"
 
-# Load JSON
-with open(JSON_FILE, "r") as f:
-    data = json.load(f)
+# Load JSON - binary read + orjson skips the text-mode UTF-8 decode
+with open(JSON_FILE, "rb") as f:
+    data = orjson.loads(f.read())
 
-# Convert to DataFrame
+# Convert to DataFrame from pre-typed arrays so pandas does no inference
 df = pd.DataFrame({
-    "timestamp": data["ts"],
-    "wind_speed": data["wind"],
-    "temp": data["temp"]
+    "timestamp": np.asarray(data["ts"]),
+    "wind_speed": np.asarray(data["wind"], dtype=np.float32),
+    "temp": np.asarray(data["temp"], dtype=np.float32)
 })
 
 # Print table